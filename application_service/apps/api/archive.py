@@ -0,0 +1,106 @@
+"""Archival of applications belonging to archived jobs.
+
+Applications of jobs that have been ``Archived`` for longer than the
+retention window are serialized together with their emails, notes, tasks, interviews and stage
+history into ``archived_applications`` and removed from the hot tables.
+This is the only thing that bounds the partitioned ``emails`` and ``notes``
+tables (see ``apps.api.partitioning``). ``get_application`` reads either store transparently.
+"""
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.forms.models import model_to_dict
+from django.utils import timezone
+
+from .models import Application, ArchivedApplication
+
+RELATED = ('emails', 'notes', 'tasks', 'interviews', 'stage_transitions')
+
+
+def _to_json(data):
+    # Round-trip through DjangoJSONEncoder so datetimes are stored as ISO strings.
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+def _row(obj):
+    row = model_to_dict(obj)
+    # model_to_dict skips non-editable fields such as AutoField keys and
+    # auto_now_add timestamps; the archive needs them.
+    for field in obj._meta.concrete_fields:
+        if not field.editable:
+            row[field.name] = getattr(obj, field.attname)
+    return row
+
+
+def serialize_application(application):
+    data = _row(application)
+    for name in RELATED:
+        data[name] = [_row(obj) for obj in getattr(application, name).all()]
+    return _to_json(data)
+
+
+def archive_cutoff(months=None):
+    months = months if months is not None else getattr(settings, 'ARCHIVE_APPLICATIONS_AFTER_MONTHS', 12)
+    return timezone.now() - timedelta(days=30 * months)
+
+
+def archive_applications(months=None, batch_size=500, max_batches=None):
+    """Move eligible applications to the cold table. Returns the number moved."""
+    cutoff = archive_cutoff(months)
+    eligible = (
+        Application.objects
+        .filter(job__status='Archived', job__archived_at__lt=cutoff)
+        .order_by('application_id')
+        .prefetch_related(*RELATED)
+    )
+    moved = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            batch = list(eligible.select_for_update(of=('self',), skip_locked=True)[:batch_size])
+            if not batch:
+                break
+            ArchivedApplication.objects.bulk_create(
+                [
+                    ArchivedApplication(
+                        application_id=app.application_id,
+                        job_id=app.job_id,
+                        candidate_id=app.candidate_id,
+                        applied_at=app.applied_at,
+                        payload=serialize_application(app),
+                    )
+                    for app in batch
+                ]
+            )
+            Application.objects.filter(pk__in=[app.pk for app in batch]).delete()
+
+        moved += len(batch)
+        batches += 1
+        if len(batch) < batch_size:
+            break
+
+    return moved
+
+
+def get_application(application_id):
+    """Return ``(data, archived)`` for an application from the hot or cold store.
+
+    Raises ``Application.DoesNotExist`` if it is in neither.
+    """
+    application = (
+        Application.objects
+        .filter(pk=application_id)
+        .prefetch_related(*RELATED)
+        .first()
+    )
+    if application is not None:
+        return serialize_application(application), False
+
+    try:
+        return ArchivedApplication.objects.get(pk=application_id).payload, True
+    except ArchivedApplication.DoesNotExist:
+        raise Application.DoesNotExist(f"Application {application_id} does not exist.")
@@ -0,0 +1,52 @@
+"""Comparison of a benchmark run against a stored baseline."""
+
+# Differences below this many milliseconds are treated as noise.
+ABSOLUTE_FLOOR_MS = 0.5
+
+
+def _environment(results):
+    meta = results.get('meta', {})
+    return meta.get('database'), '.'.join(str(meta.get('python', '')).split('.')[:2])
+
+
+def timings_comparable(current, baseline):
+    """Wall-clock timings only mean something against a baseline recorded on
+    the same database backend and Python minor version."""
+    return _environment(current) == _environment(baseline)
+
+
+def compare(current, baseline, threshold, timings=True):
+    """Return a list of human-readable regressions.
+
+    Any increase in query count and any failed load request is a regression.
+    When ``timings`` is true, a timing also regresses when it exceeds the
+    baseline by more than ``threshold`` (a fraction, 0.25 == 25%).
+    """
+    regressions = []
+
+    def check(label, now, before, metric):
+        if not timings:
+            return
+        limit = before[metric] * (1 + threshold)
+        if now[metric] > limit and now[metric] - before[metric] > ABSOLUTE_FLOOR_MS:
+            regressions.append(
+                f"{label}: {metric} {now[metric]:.3f}ms vs baseline {before[metric]:.3f}ms "
+                f"(+{(now[metric] / before[metric] - 1) * 100:.0f}%, limit +{threshold * 100:.0f}%)"
+            )
+
+    for name, before in baseline.get('queries', {}).items():
+        now = current.get('queries', {}).get(name)
+        if now is None:
+            continue
+        if now['queries'] > before['queries']:
+            regressions.append(f"{name}: {now['queries']} queries vs baseline {before['queries']}")
+        check(name, now, before, 'median_ms')
+
+    before_load = baseline.get('load', {}).get('endpoints', {})
+    for name, now in current.get('load', {}).get('endpoints', {}).items():
+        if now['errors']:
+            regressions.append(f"load {name}: {now['errors']} failed requests")
+        if name in before_load:
+            check(f"load {name}", now, before_load[name], 'p95_ms')
+
+    return regressions
@@ -0,0 +1,204 @@
+"""Seeded generator of realistic ATS data at configurable scale.
+
+``scale=1`` produces roughly 20 jobs, 2,000 candidates and 5,000
+applications with their emails, notes, tasks, interviews and stage
+history. Rows are bulk inserted, so model signals do not fire; stage
+history is written explicitly and the analytics rollups refreshed.
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from ..analytics import refresh_rollups
+from ..models import (
+    Application,
+    Candidate,
+    Email,
+    Interview,
+    Job,
+    Note,
+    PipelineStage,
+    StageTransition,
+    Task,
+)
+
+STAGES = ['Applied', 'Screening', 'Phone Interview', 'Onsite', 'Offer']
+SKILLS = [
+    'Python', 'Django', 'PostgreSQL', 'React', 'TypeScript', 'AWS', 'Docker',
+    'Kubernetes', 'Go', 'Java', 'SQL', 'Machine Learning', 'Leadership', 'Figma',
+]
+TITLES = ['Backend Engineer', 'Frontend Engineer', 'Data Scientist', 'Product Manager', 'Designer', 'SRE']
+CITIES = ['Colombo', 'Berlin', 'London', 'Remote', 'New York', 'Singapore']
+FIRST_NAMES = ['Ava', 'Liam', 'Noah', 'Mia', 'Nadun', 'Priya', 'Kenji', 'Sofia', 'Omar', 'Lena']
+LAST_NAMES = ['Perera', 'Smith', 'Garcia', 'Müller', 'Tanaka', 'Silva', 'Khan', 'Novak', 'Brown', 'Rossi']
+BATCH_SIZE = 1000
+
+
+def _paragraph(rng, words):
+    vocabulary = SKILLS + ['team', 'experience', 'ownership', 'remote', 'culture', 'growth', 'impact']
+    return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _cv(rng):
+    skills = rng.sample(SKILLS, rng.randint(3, 8))
+    return {
+        'summary': _paragraph(rng, 40),
+        'skills': skills,
+        'experience': [
+            {
+                'company': f"Company {rng.randint(1, 500)}",
+                'title': rng.choice(TITLES),
+                'years': rng.randint(1, 6),
+                'highlights': [_paragraph(rng, 12) for _ in range(3)],
+            }
+            for _ in range(rng.randint(1, 4))
+        ],
+        'education': [{'degree': rng.choice(['BSc', 'MSc', 'PhD']), 'field': 'Computer Science'}],
+    }
+
+
+def _backdate(model, objects, field, values):
+    # auto_now_add overwrites explicit values on insert, so set them afterwards.
+    for obj, value in zip(objects, values):
+        setattr(obj, field, value)
+    model.objects.bulk_update(objects, [field], batch_size=BATCH_SIZE)
+
+
+def generate(scale=1, seed=42):
+    """Populate the current database and return counts of the rows created."""
+    rng = random.Random(seed)
+    now = timezone.now()
+    n_jobs = max(1, int(20 * scale))
+    n_candidates = max(1, int(2000 * scale))
+    n_applications = max(1, int(5000 * scale))
+
+    users = User.objects.bulk_create([
+        User(username=f"bench-recruiter-{seed}-{i}", email=f"recruiter{i}@example.com")
+        for i in range(max(2, int(10 * scale)))
+    ])
+
+    jobs = Job.objects.bulk_create([
+        Job(
+            title=f"{rng.choice(TITLES)} {i}",
+            description=_paragraph(rng, 150),
+            location=rng.choice(CITIES),
+            status='Archived' if rng.random() < 0.3 else 'Active',
+            created_by=rng.choice(users),
+        )
+        for i in range(n_jobs)
+    ])
+    # bulk_create skips Job.save, which stamps archived_at; spread it over two years.
+    archived = [job for job in jobs if job.status == 'Archived']
+    _backdate(Job, archived, 'archived_at', [now - timedelta(days=30 * (i % 24)) for i in range(len(archived))])
+    PipelineStage.objects.bulk_create([
+        PipelineStage(job=job, name=name, order=order)
+        for job in jobs
+        for order, name in enumerate(STAGES)
+    ], batch_size=BATCH_SIZE)
+
+    candidates = Candidate.objects.bulk_create([
+        Candidate(
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            email=f"candidate-{seed}-{i}@example.com",
+            phone=f"+94 7{rng.randint(10000000, 99999999)}",
+            resume_file_path=f"resumes/{seed}/{i}.pdf",
+            parsed_cv_data=_cv(rng),
+        )
+        for i in range(n_candidates)
+    ], batch_size=BATCH_SIZE)
+
+    pairs = set()
+    while len(pairs) < min(n_applications, n_jobs * n_candidates):
+        pairs.add((rng.randrange(n_jobs), rng.randrange(n_candidates)))
+
+    plans = []
+    for job_index, candidate_index in sorted(pairs):
+        reached = rng.choices(range(len(STAGES)), weights=[40, 25, 15, 10, 10])[0]
+        if reached == len(STAGES) - 1:
+            status = rng.choice(['Hired', 'Hired', 'Rejected', 'Withdrawn'])
+        else:
+            status = rng.choice(['New', 'Interview', 'Rejected', 'On Hold'])
+        plans.append((jobs[job_index], candidates[candidate_index], reached, status, now - timedelta(days=rng.uniform(0, 365))))
+
+    applications = Application.objects.bulk_create([
+        Application(job=job, candidate=candidate, current_stage=STAGES[reached], status=status)
+        for job, candidate, reached, status, _ in plans
+    ], batch_size=BATCH_SIZE)
+    _backdate(Application, applications, 'applied_at', [plan[4] for plan in plans])
+
+    transitions, transition_times = [], []
+    for application, (_, _, reached, status, applied_at) in zip(applications, plans):
+        at, stage, current_status = applied_at, None, None
+        for step in range(reached + 1):
+            next_status = status if step == reached else ('New' if step == 0 else 'Interview')
+            transitions.append(StageTransition(
+                application=application,
+                job_id=application.job_id,
+                from_stage=stage,
+                to_stage=STAGES[step],
+                from_status=current_status,
+                to_status=next_status,
+                is_submission=step == 0,
+                applied_at=applied_at,
+            ))
+            transition_times.append(min(at, now))
+            stage, current_status = STAGES[step], next_status
+            at += timedelta(days=rng.uniform(1, 10))
+    transitions = StageTransition.objects.bulk_create(transitions, batch_size=BATCH_SIZE)
+    _backdate(StageTransition, transitions, 'transitioned_at', transition_times)
+
+    emails, notes, tasks, interviews = [], [], [], []
+    for application, (_, candidate, reached, _, applied_at) in zip(applications, plans):
+        for _ in range(rng.randint(0, 4)):
+            emails.append(Email(
+                application=application,
+                sender_user=rng.choice(users),
+                recipient_email=candidate.email,
+                subject=f"Your application: {STAGES[reached]}",
+                content=_paragraph(rng, 120),
+            ))
+        for _ in range(rng.randint(0, 3)):
+            notes.append(Note(application=application, user=rng.choice(users), content=_paragraph(rng, 60)))
+        if rng.random() < 0.5:
+            tasks.append(Task(
+                application=application,
+                assigned_to_user=rng.choice(users),
+                description=_paragraph(rng, 20),
+                due_date=now + timedelta(days=rng.uniform(-30, 30)),
+                completed=rng.random() < 0.6,
+            ))
+        # Interview.panel_user_ids is an ArrayField, which only PostgreSQL can store.
+        if reached >= 2 and connection.vendor == 'postgresql':
+            interviews.append(Interview(
+                application=application,
+                scheduled_time=applied_at + timedelta(days=rng.uniform(3, 40)),
+                calendar_event_id=f"evt-{seed}-{application.pk}",
+                panel_user_ids=[user.pk for user in rng.sample(users, 2)],
+            ))
+
+    emails = Email.objects.bulk_create(emails, batch_size=BATCH_SIZE)
+    _backdate(Email, emails, 'sent_at', [now - timedelta(days=rng.uniform(0, 365)) for _ in emails])
+    notes = Note.objects.bulk_create(notes, batch_size=BATCH_SIZE)
+    _backdate(Note, notes, 'created_at', [now - timedelta(days=rng.uniform(0, 365)) for _ in notes])
+    Task.objects.bulk_create(tasks, batch_size=BATCH_SIZE)
+    Interview.objects.bulk_create(interviews, batch_size=BATCH_SIZE)
+
+    with override_settings(ANALYTICS_ROLLUP_SETTLE_SECONDS=0):
+        refresh_rollups()
+
+    return {
+        'users': len(users),
+        'jobs': len(jobs),
+        'candidates': len(candidates),
+        'applications': len(applications),
+        'stage_transitions': len(transitions),
+        'emails': len(emails),
+        'notes': len(notes),
+        'tasks': len(tasks),
+        'interviews': len(interviews),
+    }
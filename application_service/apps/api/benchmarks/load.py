@@ -0,0 +1,94 @@
+"""Local HTTP load scenario against an in-process threaded WSGI server."""
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from django.contrib.auth.models import User
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+from django.core.wsgi import get_wsgi_application
+from django.test import Client
+
+from .queries import Fixture, _percentile
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def scenario(fx):
+    """(name, path, weight) for the requests a recruiter dashboard issues."""
+    return [
+        ('health', '/health/', 1),
+        ('application_detail', f'/api/v1/applications/{fx.application_id}/', 4),
+        ('applications_per_day', f'/api/v1/analytics/jobs/{fx.job_id}/applications-per-day/', 2),
+        ('stage_conversion', f'/api/v1/analytics/jobs/{fx.job_id}/stage-conversion/', 2),
+        ('time_to_hire', f'/api/v1/analytics/jobs/{fx.job_id}/time-to-hire/', 1),
+    ]
+
+
+def _session_cookie():
+    user, _ = User.objects.get_or_create(username='bench-load-user')
+    client = Client()
+    client.force_login(user)
+    return client.cookies['sessionid'].value
+
+
+def run(requests=500, concurrency=8, seed=42):
+    fx = Fixture()
+    routes = scenario(fx)
+    rng = random.Random(seed)
+    plan = rng.choices(routes, weights=[weight for _, _, weight in routes], k=requests)
+    cookies = {'sessionid': _session_cookie()}
+
+    server = ThreadedWSGIServer(('127.0.0.1', 0), QuietHandler, allow_reuse_address=False)
+    server.set_app(get_wsgi_application())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    samples = {name: [] for name, _, _ in routes}
+    errors = {name: 0 for name, _, _ in routes}
+    local = threading.local()
+
+    def fire(route):
+        name, path, _ = route
+        if not hasattr(local, 'client'):
+            local.client = httpx.Client(base_url=base_url, cookies=cookies, headers={'Host': 'testserver'})
+        start = time.perf_counter()
+        try:
+            ok = local.client.get(path).is_success
+        except httpx.HTTPError:
+            ok = False
+        return name, (time.perf_counter() - start) * 1000, ok
+
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for name, elapsed, ok in pool.map(fire, plan):
+                samples[name].append(elapsed)
+                if not ok:
+                    errors[name] += 1
+    finally:
+        server.shutdown()
+        server.server_close()
+    duration = time.perf_counter() - started
+
+    results = {}
+    for name, values in samples.items():
+        if values:
+            results[name] = {
+                'requests': len(values),
+                'errors': errors[name],
+                'median_ms': round(statistics.median(values), 4),
+                'p95_ms': round(_percentile(values, 0.95), 4),
+            }
+    return {
+        'concurrency': concurrency,
+        'requests': requests,
+        'throughput_rps': round(requests / duration, 2),
+        'endpoints': results,
+    }
@@ -0,0 +1,138 @@
+"""Micro-benchmarks for the ORM queries behind the hottest endpoints."""
+import statistics
+import time
+
+from django.db import connection
+from django.db.models import Count, Q
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ..archive import get_application
+from ..models import (
+    Application,
+    Candidate,
+    DailyApplicationRollup,
+    DailyStageConversionRollup,
+    Interview,
+    Job,
+    Task,
+)
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+class Fixture:
+    """Representative ids picked once from the seeded data."""
+
+    def __init__(self):
+        self.job_id = (
+            Job.objects.annotate(n=Count('applications')).order_by('-n', 'job_id')
+            .values_list('job_id', flat=True).first()
+        )
+        self.application_id = (
+            Application.objects.filter(job_id=self.job_id).order_by('application_id')
+            .values_list('application_id', flat=True).first()
+        )
+        self.user_id = Task.objects.order_by('task_id').values_list('assigned_to_user_id', flat=True).first()
+        self.email = Candidate.objects.order_by('candidate_id').values_list('email', flat=True).first()
+
+
+@benchmark('job_applications_page')
+def job_applications_page(fx):
+    return list(
+        Application.objects.filter(job_id=fx.job_id)
+        .select_related('candidate')
+        .order_by('-applied_at')[:20]
+    )
+
+
+@benchmark('pipeline_board_counts')
+def pipeline_board_counts(fx):
+    return list(
+        Application.objects.filter(job_id=fx.job_id)
+        .values('current_stage', 'status')
+        .annotate(n=Count('application_id'))
+    )
+
+
+@benchmark('application_detail')
+def application_detail(fx):
+    return get_application(fx.application_id)
+
+
+@benchmark('candidate_lookup_by_email')
+def candidate_lookup_by_email(fx):
+    return Candidate.objects.filter(email=fx.email).first()
+
+
+@benchmark('candidate_name_search')
+def candidate_name_search(fx):
+    return list(Candidate.objects.filter(Q(first_name__icontains='pri') | Q(last_name__icontains='per'))[:20])
+
+
+@benchmark('open_tasks_for_user')
+def open_tasks_for_user(fx):
+    return list(
+        Task.objects.filter(assigned_to_user_id=fx.user_id, completed=False)
+        .select_related('application__candidate', 'application__job')[:50]
+    )
+
+
+@benchmark('upcoming_interviews')
+def upcoming_interviews(fx):
+    return list(
+        Interview.objects.filter(scheduled_time__gte=timezone.now())
+        .select_related('application__candidate')[:50]
+    )
+
+
+@benchmark('active_jobs_with_counts')
+def active_jobs_with_counts(fx):
+    return list(Job.objects.filter(status='Active').annotate(n=Count('applications'))[:20])
+
+
+@benchmark('analytics_rollups')
+def analytics_rollups(fx):
+    today = timezone.localdate()
+    start = today.replace(year=today.year - 1)
+    return (
+        list(DailyApplicationRollup.objects.filter(job_id=fx.job_id, day__range=(start, today))),
+        list(DailyStageConversionRollup.objects.filter(job_id=fx.job_id, day__range=(start, today))),
+    )
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def run(iterations=50, warmup=5, names=None):
+    fx = Fixture()
+    results = {}
+    for name, func in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for _ in range(warmup):
+            func(fx)
+        with CaptureQueriesContext(connection) as captured:
+            func(fx)
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func(fx)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            'iterations': iterations,
+            'queries': len(captured),
+            'mean_ms': round(statistics.fmean(samples), 4),
+            'median_ms': round(statistics.median(samples), 4),
+            'p95_ms': round(_percentile(samples, 0.95), 4),
+        }
+    return results
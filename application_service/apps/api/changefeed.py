@@ -0,0 +1,175 @@
+"""Per-job change feed for recruiter pipeline boards.
+
+Model saves publish small JSON deltas to a Redis channel per job once the
+transaction commits. Each ASGI process keeps a single pattern subscription
+and fans messages out to in-memory queues, one per connected client, so an
+idle server-sent-events connection costs a coroutine and a queue rather
+than a Redis connection.
+"""
+import asyncio
+import json
+import logging
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'pipeline:job:'
+
+_client = None
+
+
+def channel_for_job(job_id):
+    return f"{CHANNEL_PREFIX}{job_id}"
+
+
+def _redis_url():
+    return getattr(settings, 'CHANGEFEED_REDIS_URL', 'redis://localhost:6379/1')
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        # Imported on first publish so processes that never publish skip it.
+        import redis
+
+        # Publishing runs inside the saving request, so an unreachable Redis
+        # must fail fast rather than wait for the OS TCP timeout.
+        timeout = getattr(settings, 'CHANGEFEED_SOCKET_TIMEOUT', 0.5)
+        _client = redis.Redis.from_url(
+            _redis_url(), socket_connect_timeout=timeout, socket_timeout=timeout,
+        )
+    return _client
+
+
+def reset_client():
+    """Drop the publishing client so a forked process opens its own connections."""
+    global _client
+    _client = None
+
+
+def publish_change(job_id, kind, pk, fields):
+    """Publish a delta for ``kind``/``pk`` on the job's channel after commit.
+
+    Failures are logged and never propagate into the saving request.
+    """
+    if not getattr(settings, 'CHANGEFEED_ENABLED', True):
+        return
+
+    message = json.dumps({'type': kind, 'id': pk, 'fields': fields}, cls=DjangoJSONEncoder)
+
+    def send():
+        from redis import RedisError
+
+        try:
+            _get_client().publish(channel_for_job(job_id), message)
+        except RedisError:
+            logger.exception("Could not publish %s %s change for job %s", kind, pk, job_id)
+
+    transaction.on_commit(send)
+
+
+class Subscription:
+    def __init__(self, job_id, maxsize):
+        self.job_id = job_id
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def put(self, delta):
+        try:
+            self.queue.put_nowait(delta)
+        except asyncio.QueueFull:
+            # The client fell behind; tell it to refetch instead of buffering forever.
+            self.overflowed = True
+
+
+class Broadcaster:
+    """Fans messages from one Redis pattern subscription out to local subscribers."""
+
+    def __init__(self, url=None, queue_size=1000):
+        self.url = url
+        self.queue_size = queue_size
+        self.subscribers = {}
+        self._task = None
+
+    def subscribe(self, job_id):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        subscription = Subscription(job_id, self.queue_size)
+        self.subscribers.setdefault(job_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        subscribers = self.subscribers.get(subscription.job_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self.subscribers[subscription.job_id]
+
+    def dispatch(self, channel, data):
+        try:
+            job_id = int(channel[len(CHANNEL_PREFIX):])
+            delta = json.loads(data)
+        except ValueError:
+            logger.warning("Ignoring malformed change on %s", channel)
+            return
+        for subscription in tuple(self.subscribers.get(job_id, ())):
+            subscription.put(delta)
+
+    async def _run(self):
+        import redis.asyncio
+
+        while True:
+            client = redis.asyncio.Redis.from_url(self.url or _redis_url(), decode_responses=True)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                    async for message in pubsub.listen():
+                        if message['type'] == 'pmessage':
+                            self.dispatch(message['channel'], message['data'])
+            except asyncio.CancelledError:
+                raise
+            except redis.RedisError:
+                logger.exception("Change feed subscription lost; reconnecting")
+                # Deltas published while disconnected are gone; make clients resync.
+                for subscribers in self.subscribers.values():
+                    for subscription in subscribers:
+                        subscription.overflowed = True
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+
+def coalesce(deltas):
+    """Merge deltas for the same object, later fields winning, keeping first-seen order."""
+    merged = {}
+    for delta in deltas:
+        key = (delta['type'], delta['id'])
+        if key in merged:
+            merged[key]['fields'].update(delta['fields'])
+        else:
+            merged[key] = {'type': delta['type'], 'id': delta['id'], 'fields': dict(delta['fields'])}
+    return list(merged.values())
+
+
+async def next_batch(subscription, window, heartbeat):
+    """Wait up to ``heartbeat`` seconds for a change, then collect for ``window`` seconds.
+
+    Returns ``None`` on heartbeat timeout.
+    """
+    try:
+        first = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+    except asyncio.TimeoutError:
+        return None
+
+    batch = [first]
+    if window:
+        await asyncio.sleep(window)
+    while not subscription.queue.empty():
+        batch.append(subscription.queue.get_nowait())
+    return coalesce(batch)
+
+
+broadcaster = Broadcaster()
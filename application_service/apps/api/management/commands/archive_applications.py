@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.api.archive import archive_applications
+
+
+class Command(BaseCommand):
+    help = 'Move applications of archived jobs past the retention window into cold storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months', type=int, default=None)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--max-batches', type=int, default=None)
+
+    def handle(self, *args, **options):
+        moved = archive_applications(
+            months=options['months'],
+            batch_size=options['batch_size'],
+            max_batches=options['max_batches'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Archived {moved} applications'))
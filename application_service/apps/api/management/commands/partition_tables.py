@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import NotSupportedError
+
+from apps.api import partitioning
+
+
+class Command(BaseCommand):
+    help = 'Create or convert monthly partitions for the emails and notes tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--table', choices=sorted(partitioning.PARTITIONED_TABLES), action='append')
+        parser.add_argument('--convert', action='store_true', help='Rebuild unpartitioned tables as partitioned')
+        parser.add_argument('--months-ahead', type=int, default=3)
+
+    def handle(self, *args, **options):
+        tables = options['table'] or sorted(partitioning.PARTITIONED_TABLES)
+
+        try:
+            for table in tables:
+                if not partitioning.is_partitioned(table):
+                    if not options['convert']:
+                        raise CommandError(f'{table} is not partitioned; rerun with --convert')
+                    partitioning.convert_to_partitioned(table, options['months_ahead'])
+                    self.stdout.write(f'Converted {table} to monthly partitions')
+
+                created = partitioning.ensure_partitions(table, options['months_ahead'])
+                self.stdout.write(f"{table}: partitions present through {created[-1]}")
+        except NotSupportedError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS('Done'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.api.analytics import refresh_rollups
+
+
+class Command(BaseCommand):
+    help = 'Fold new stage transitions into the daily analytics rollups'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-batches', type=int, default=None)
+
+    def handle(self, *args, **options):
+        processed = refresh_rollups(max_batches=options['max_batches'])
+        self.stdout.write(self.style.SUCCESS(f'Processed {processed} transitions'))
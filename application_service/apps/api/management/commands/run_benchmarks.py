@@ -0,0 +1,121 @@
+import json
+import os
+import platform
+import tempfile
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+
+from apps.api.benchmarks import data, load, queries
+from apps.api.benchmarks.compare import compare, timings_comparable
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed a throwaway test database, run ORM micro-benchmarks and a local HTTP load '
+        'scenario, write the results as JSON and fail on regressions against a baseline'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=500, help='Requests issued by the load scenario')
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--skip-load', action='store_true')
+        parser.add_argument('--output', default='benchmark-results.json')
+        parser.add_argument('--baseline', default=None, help='Baseline JSON to compare against')
+        parser.add_argument(
+            '--threshold', type=float, default=getattr(settings, 'BENCHMARK_REGRESSION_THRESHOLD', 0.25),
+            help='Allowed slowdown as a fraction of the baseline (0.25 == 25%%)',
+        )
+        parser.add_argument('--update-baseline', action='store_true', help='Write the results to --baseline')
+        parser.add_argument(
+            '--counts-only', action='store_true',
+            help='Only gate on query counts and failed requests, which are stable across machines',
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['baseline'] and not options['update_baseline']:
+            try:
+                baseline = json.loads(Path(options['baseline']).read_text())
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Could not read baseline {options['baseline']}: {exc}")
+
+        results = self._run(options)
+        output = json.dumps(results, indent=2, sort_keys=True) + '\n'
+        Path(options['output']).write_text(output)
+        self.stdout.write(f"Results written to {options['output']}")
+
+        for name, stats in results['queries'].items():
+            self.stdout.write(f"  {name:<28} {stats['median_ms']:>9.3f}ms median  {stats['queries']} queries")
+        if 'load' in results:
+            self.stdout.write(f"  load throughput             {results['load']['throughput_rps']:>9.2f} req/s")
+
+        if options['update_baseline']:
+            if not options['baseline']:
+                raise CommandError('--update-baseline requires --baseline')
+            Path(options['baseline']).write_text(output)
+            self.stdout.write(self.style.SUCCESS(f"Baseline updated: {options['baseline']}"))
+            return
+
+        if baseline is not None:
+            timings = not options['counts_only']
+            if timings and not timings_comparable(results, baseline):
+                timings = False
+                self.stdout.write(self.style.WARNING(
+                    'Baseline was recorded on a different database or Python version; '
+                    'comparing query counts and failed requests only'
+                ))
+            regressions = compare(results, baseline, options['threshold'], timings=timings)
+            if regressions:
+                for line in regressions:
+                    self.stderr.write(f"  REGRESSION {line}")
+                raise CommandError(f"{len(regressions)} benchmark regression(s) against {options['baseline']}")
+            self.stdout.write(self.style.SUCCESS('No regressions against baseline'))
+
+    def _run(self, options):
+        test_settings = connection.settings_dict.setdefault('TEST', {})
+        tmpdir = None
+        if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+            # The load scenario serves requests from other threads, which cannot
+            # see an in-memory SQLite database.
+            tmpdir = tempfile.mkdtemp(prefix='ats-bench-')
+            test_settings['NAME'] = os.path.join(tmpdir, 'bench.sqlite3')
+
+        setup_test_environment(debug=False)
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with override_settings(JOB_PUBLISHING_ENABLED=False, CHANGEFEED_ENABLED=False):
+                counts = data.generate(scale=options['scale'], seed=options['seed'])
+                results = {
+                    'meta': {
+                        'scale': options['scale'],
+                        'seed': options['seed'],
+                        'database': connection.vendor,
+                        'python': platform.python_version(),
+                        'django': django.get_version(),
+                        'generated_at': timezone.now().isoformat(),
+                        'rows': counts,
+                    },
+                    'queries': queries.run(iterations=options['iterations']),
+                }
+                if not options['skip_load']:
+                    results['load'] = load.run(
+                        requests=options['requests'],
+                        concurrency=options['concurrency'],
+                        seed=options['seed'],
+                    )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+            if tmpdir:
+                test_settings.pop('NAME', None)
+                Path(tmpdir).rmdir()
+        return results
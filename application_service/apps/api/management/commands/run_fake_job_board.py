@@ -0,0 +1,92 @@
+import json
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+
+from django.core.management.base import BaseCommand
+
+
+class FakeJobBoard(ThreadingHTTPServer):
+    """In-memory job board speaking the protocol used by apps.api.publishing."""
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, failure_rate=0.0, verbose=True):
+        super().__init__(address, FakeJobBoardHandler)
+        self.verbose = verbose
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.jobs = {}
+        self.seen_keys = {}
+        self.requests = []
+        self.lock = Lock()
+
+
+class FakeJobBoardHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self):
+        board = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or b'{}')
+        key = self.headers.get('Idempotency-Key')
+
+        if board.latency:
+            time.sleep(board.latency)
+
+        with board.lock:
+            board.requests.append({'method': self.command, 'path': self.path, 'key': key, 'body': body})
+            if key in board.seen_keys:
+                return self._reply(*board.seen_keys[key])
+            if random.random() < board.failure_rate:
+                return self._reply(503, {'detail': 'temporarily unavailable'})
+
+            parts = self.path.strip('/').split('/')
+            if self.command == 'POST' and parts == ['jobs']:
+                board.jobs[str(body['external_id'])] = dict(body)
+                result = (201, body)
+            elif self.command == 'PATCH' and len(parts) == 2 and parts[0] == 'jobs' and parts[1] in board.jobs:
+                board.jobs[parts[1]].update(body)
+                result = (200, board.jobs[parts[1]])
+            else:
+                result = (404, {'detail': 'not found'})
+
+            if key:
+                board.seen_keys[key] = result
+            return self._reply(*result)
+
+    do_POST = _handle
+    do_PATCH = _handle
+
+    def do_GET(self):
+        with self.server.lock:
+            self._reply(200, {'jobs': self.server.jobs, 'requests': len(self.server.requests)})
+
+
+class Command(BaseCommand):
+    help = 'Run a local fake job board for exercising job publishing'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--latency', type=float, default=0.0, help='Seconds to delay each response')
+        parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of requests answered with 503')
+
+    def handle(self, *args, **options):
+        server = FakeJobBoard(('127.0.0.1', options['port']), options['latency'], options['failure_rate'])
+        self.stdout.write(f"Fake job board listening on http://127.0.0.1:{options['port']}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from apps.api.benchmarks.data import generate
+
+
+class Command(BaseCommand):
+    help = 'Populate the configured database with seeded benchmark data'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        with override_settings(JOB_PUBLISHING_ENABLED=False, CHANGEFEED_ENABLED=False):
+            counts = generate(scale=options['scale'], seed=options['seed'])
+        for name, count in counts.items():
+            self.stdout.write(f"  {name:<18} {count}")
+        self.stdout.write(self.style.SUCCESS('Seeded benchmark data'))
@@ -0,0 +1,115 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PROFILES = ('api', 'worker', 'production')
+
+# Runs in a fresh interpreter so nothing this command imported skews the numbers.
+PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+timings = {"django_setup_ms": (time.perf_counter() - start) * 1000}
+mark = time.perf_counter()
+if sys.argv[1] == "worker":
+    from config.celery import app
+    app.loader.import_default_modules()
+    timings["load_tasks_ms"] = (time.perf_counter() - mark) * 1000
+else:
+    # What gunicorn's UvicornWorker loads: the ASGI app and middleware, then the URLconf.
+    import config.asgi
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+    timings["load_asgi_and_urls_ms"] = (time.perf_counter() - mark) * 1000
+timings["total_ms"] = (time.perf_counter() - start) * 1000
+timings["modules_loaded"] = len(sys.modules)
+print(json.dumps(timings))
+'''
+
+
+def parse_importtime(stderr):
+    """Return ``[(module, self_us, cumulative_us, depth)]`` from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        head, cumulative_us, name = line.split('|', 2)
+        self_us = head.split(':', 1)[1]
+        # One separating space, then two more per level of nesting.
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+class Command(BaseCommand):
+    help = 'Measure startup and import time for each settings profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', choices=PROFILES, action='append', help='Profile(s) to measure (default: all)')
+        parser.add_argument('--top', type=int, default=10, help='Number of slowest packages and modules to list')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def _measure(self, profile):
+        env = {
+            **os.environ,
+            'DJANGO_SETTINGS_MODULE': f'config.settings.{profile}',
+            'ALLOWED_HOSTS': os.environ.get('ALLOWED_HOSTS', 'localhost'),
+        }
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', PROBE, profile],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise CommandError(f'{profile} failed to start:\n{proc.stderr[-2000:]}')
+
+        report = json.loads(proc.stdout.strip().splitlines()[-1])
+        rows = parse_importtime(proc.stderr)
+        packages = defaultdict(int)
+        for module, self_us, _, _ in rows:
+            packages[module.split('.')[0]] += self_us
+        report['import_ms'] = round(sum(row[1] for row in rows) / 1000, 1)
+        report['packages'] = [
+            {'package': name, 'self_ms': round(us / 1000, 1)}
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])
+        ]
+        report['modules'] = [
+            {'module': module, 'cumulative_ms': round(cumulative / 1000, 1)}
+            for module, _, cumulative, depth in sorted(rows, key=lambda row: -row[2])
+            if depth == 0
+        ]
+        for key in ('django_setup_ms', 'load_tasks_ms', 'load_asgi_and_urls_ms', 'total_ms'):
+            if key in report:
+                report[key] = round(report[key], 1)
+        return report
+
+    def handle(self, *args, **options):
+        top = options['top']
+        reports = {profile: self._measure(profile) for profile in options['profile'] or PROFILES}
+
+        if options['json']:
+            for report in reports.values():
+                report['packages'] = report['packages'][:top]
+                report['modules'] = report['modules'][:top]
+            self.stdout.write(json.dumps(reports, indent=2))
+            return
+
+        for profile, report in reports.items():
+            phase = 'load_tasks_ms' if 'load_tasks_ms' in report else 'load_asgi_and_urls_ms'
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{profile}'))
+            self.stdout.write(
+                f"  total {report['total_ms']}ms (django.setup {report['django_setup_ms']}ms, "
+                f"{phase[:-3].replace('_', ' ')} {report[phase]}ms), "
+                f"{report['modules_loaded']} modules, {report['import_ms']}ms importing"
+            )
+            self.stdout.write('  slowest packages (self time):')
+            for row in report['packages'][:top]:
+                self.stdout.write(f"    {row['package']:<32} {row['self_ms']:>8.1f}ms")
+            self.stdout.write('  slowest top-level imports (cumulative):')
+            for row in report['modules'][:top]:
+                self.stdout.write(f"    {row['module']:<32} {row['cumulative_ms']:>8.1f}ms")
@@ -4,6 +4,14 @@ from .application import Application
 from .communication import Email, Note
 from .task import Task
 from .interview import Interview
+from .analytics import (
+    StageTransition,
+    RollupCheckpoint,
+    DailyApplicationRollup,
+    DailyStageConversionRollup,
+)
+from .archive import ArchivedApplication
+from .publishing import JobBoard, JobPublication, PublishDelivery
 
 __all__ = [
     'Candidate',
@@ -14,4 +22,12 @@ __all__ = [
     'Note',
     'Task',
     'Interview',
+    'StageTransition',
+    'RollupCheckpoint',
+    'DailyApplicationRollup',
+    'DailyStageConversionRollup',
+    'ArchivedApplication',
+    'JobBoard',
+    'JobPublication',
+    'PublishDelivery',
 ]
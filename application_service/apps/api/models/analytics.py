@@ -0,0 +1,76 @@
+from django.db import models
+from .job import Job
+from .application import Application
+
+
+class StageTransition(models.Model):
+    """Append-only history of Application stage/status changes.
+
+    ``is_submission`` marks the row written when the application was created.
+    """
+    transition_id = models.BigAutoField(primary_key=True)
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='stage_transitions')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='stage_transitions')
+    from_stage = models.CharField(max_length=100, blank=True, null=True)
+    to_stage = models.CharField(max_length=100, blank=True, null=True)
+    from_status = models.CharField(max_length=20, blank=True, null=True)
+    to_status = models.CharField(max_length=20)
+    is_submission = models.BooleanField(default=False)
+    applied_at = models.DateTimeField()
+    transitioned_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'stage_transitions'
+        ordering = ['transition_id']
+        indexes = [
+            models.Index(fields=['application', 'transitioned_at']),
+            models.Index(fields=['transitioned_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_stage} -> {self.to_stage} ({self.to_status})"
+
+
+class RollupCheckpoint(models.Model):
+    """Last StageTransition folded into the rollups by a given job."""
+    name = models.CharField(max_length=50, primary_key=True)
+    last_transition_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'rollup_checkpoints'
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_transition_id}"
+
+
+class DailyApplicationRollup(models.Model):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='daily_application_rollups')
+    day = models.DateField()
+    applications = models.PositiveIntegerField(default=0)
+    hires = models.PositiveIntegerField(default=0)
+    total_seconds_to_hire = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_application_rollups'
+        ordering = ['job', 'day']
+        unique_together = ['job', 'day']
+
+    def __str__(self):
+        return f"{self.job_id} {self.day}: {self.applications} applied, {self.hires} hired"
+
+
+class DailyStageConversionRollup(models.Model):
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='daily_stage_rollups')
+    day = models.DateField()
+    from_stage = models.CharField(max_length=100, blank=True, default='')
+    to_stage = models.CharField(max_length=100, blank=True, default='')
+    transitions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'daily_stage_conversion_rollups'
+        ordering = ['job', 'day']
+        unique_together = ['job', 'day', 'from_stage', 'to_stage']
+
+    def __str__(self):
+        return f"{self.job_id} {self.day}: {self.from_stage} -> {self.to_stage} x{self.transitions}"
@@ -27,3 +27,22 @@ class Application(models.Model):
 
     def __str__(self):
         return f"{self.candidate.full_name} - {self.job.title}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._remember_loaded_state()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self._remember_loaded_state()
+
+    def _remember_loaded_state(self):
+        # Remember the persisted stage/status so post_save can record transitions
+        # without re-reading the row. Deferred fields leave no snapshot; the
+        # pre_save signal reads those from the database instead.
+        if 'current_stage' in self.__dict__ and 'status' in self.__dict__:
+            self._loaded_state = (self.current_stage, self.status)
+        else:
+            self.__dict__.pop('_loaded_state', None)
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class ArchivedApplication(models.Model):
+    """Cold copy of an Application (and its emails, notes, tasks, interviews)
+    moved out of the hot tables after its job was archived."""
+    application_id = models.IntegerField(primary_key=True)
+    job_id = models.IntegerField(db_index=True)
+    candidate_id = models.IntegerField(db_index=True)
+    applied_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    payload = models.JSONField()
+
+    class Meta:
+        db_table = 'archived_applications'
+        ordering = ['-applied_at']
+
+    def __str__(self):
+        return f"Archived application {self.application_id} (job {self.job_id})"
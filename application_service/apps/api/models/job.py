@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class Job(models.Model):
@@ -16,6 +17,8 @@ class Job(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='created_jobs')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # When the job last became Archived; the archival retention window runs from here.
+    archived_at = models.DateTimeField(blank=True, null=True)
 
     class Meta:
         db_table = 'jobs'
@@ -24,6 +27,14 @@ class Job(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        archived = self.status == 'Archived'
+        if archived != (self.archived_at is not None):
+            self.archived_at = timezone.now() if archived else None
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'archived_at'}
+        super().save(*args, **kwargs)
+
 
 class PipelineStage(models.Model):
     stage_id = models.AutoField(primary_key=True)
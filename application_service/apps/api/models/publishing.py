@@ -0,0 +1,76 @@
+from django.db import models
+from .job import Job
+
+
+class JobBoard(models.Model):
+    board_id = models.AutoField(primary_key=True)
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(unique=True)
+    endpoint_url = models.URLField(help_text="Base URL; postings are sent to <endpoint_url>/jobs")
+    api_key = models.CharField(max_length=200, blank=True, default='')
+    max_concurrency = models.PositiveIntegerField(default=4)
+    max_retries = models.PositiveIntegerField(default=3)
+    timeout_seconds = models.FloatField(default=10.0)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        db_table = 'job_boards'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class JobPublication(models.Model):
+    """What a board currently holds for a job, used to send only changed fields."""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='publications')
+    board = models.ForeignKey(JobBoard, on_delete=models.CASCADE, related_name='publications')
+    published_fields = models.JSONField(default=dict)
+    version = models.PositiveIntegerField(default=0)
+    published_at = models.DateTimeField(auto_now=True)
+    # The Job.updated_at this publication is known to reflect; a job saved
+    # after it still has to be delivered to this board.
+    synced_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'job_publications'
+        unique_together = ['job', 'board']
+
+    def __str__(self):
+        return f"{self.job} on {self.board}"
+
+
+class PublishDelivery(models.Model):
+    STATUS_CHOICES = [
+        ('Pending', 'Pending'),
+        ('Succeeded', 'Succeeded'),
+        ('Failed', 'Failed'),
+        ('Superseded', 'Superseded'),
+    ]
+    ACTION_CHOICES = [
+        ('create', 'create'),
+        ('update', 'update'),
+    ]
+
+    delivery_id = models.BigAutoField(primary_key=True)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='publish_deliveries')
+    board = models.ForeignKey(JobBoard, on_delete=models.CASCADE, related_name='deliveries')
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    idempotency_key = models.CharField(max_length=64, unique=True)
+    payload = models.JSONField()
+    # Job.updated_at when this delivery was (last) planned.
+    job_updated_at = models.DateTimeField(blank=True, null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Pending')
+    attempts = models.PositiveIntegerField(default=0)
+    response_status = models.PositiveIntegerField(blank=True, null=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    delivered_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = 'publish_deliveries'
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['job', 'board', 'status'])]
+
+    def __str__(self):
+        return f"{self.action} {self.job_id} -> {self.board_id} ({self.status})"
@@ -0,0 +1,122 @@
+"""Monthly range partitioning for the append-mostly communication tables.
+
+PostgreSQL only. ``emails`` and ``notes`` are converted once to tables
+partitioned by month on their timestamp column; afterwards a scheduled job
+keeps future partitions created. Each month gets its own heap and indexes,
+so vacuum and reindex work one month at a time and time-range queries only
+touch the months they ask for.
+
+Partitioning does not remove data by itself. The hot tables are bounded by
+archival (``apps.api.archive``), which copies the emails and notes of old
+applications into the cold payload and deletes them from these tables;
+autovacuum then reclaims that space inside the affected partitions.
+Partitions are never detached because they always mix rows of archived and
+still-hot applications.
+"""
+from datetime import date
+
+from django.db import NotSupportedError, connection, transaction
+
+PARTITIONED_TABLES = {
+    'emails': {'pk': 'email_id', 'column': 'sent_at', 'foreign_keys': {
+        'application_id': ('applications', 'application_id'),
+        'sender_user_id': ('auth_user', 'id'),
+    }},
+    'notes': {'pk': 'note_id', 'column': 'created_at', 'foreign_keys': {
+        'application_id': ('applications', 'application_id'),
+        'user_id': ('auth_user', 'id'),
+    }},
+}
+
+
+def _add_months(day, months):
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def _month_start(day):
+    return date(day.year, day.month, 1)
+
+
+def partition_name(table, month):
+    return f"{table}_p{month:%Y_%m}"
+
+
+def _check_backend():
+    if connection.vendor != 'postgresql':
+        raise NotSupportedError('Table partitioning requires PostgreSQL.')
+
+
+def is_partitioned(table):
+    _check_backend()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [table],
+        )
+        return cursor.fetchone() is not None
+
+
+def create_partition(cursor, table, month):
+    name = partition_name(table, month)
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+    )
+    return name
+
+
+def ensure_partitions(table, months_ahead=3, today=None):
+    """Create partitions from the current month through ``months_ahead`` months."""
+    _check_backend()
+    start = _month_start(today or date.today())
+    with connection.cursor() as cursor:
+        return [create_partition(cursor, table, _add_months(start, i)) for i in range(months_ahead + 1)]
+
+
+def convert_to_partitioned(table, months_ahead=3):
+    """Rebuild ``table`` as a monthly partitioned table, copying existing rows.
+
+    Runs in one transaction and holds an exclusive lock on the table while
+    rows are copied; schedule it in a maintenance window.
+    """
+    _check_backend()
+    spec = PARTITIONED_TABLES[table]
+    pk, column = spec['pk'], spec['column']
+    legacy = f"{table}_unpartitioned"
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE "{table}" IN ACCESS EXCLUSIVE MODE')
+        cursor.execute(f'SELECT min("{column}"), max("{column}") FROM "{table}"')
+        first, last = cursor.fetchone()
+
+        cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{legacy}"')
+        cursor.execute(
+            f'CREATE TABLE "{table}" (LIKE "{legacy}" INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE ("{column}")'
+        )
+        # The partition key has to be part of every unique constraint.
+        cursor.execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY ("{pk}", "{column}")')
+        for fk_column, (ref_table, ref_column) in spec['foreign_keys'].items():
+            cursor.execute(
+                f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_{fk_column}_fk" FOREIGN KEY ("{fk_column}") '
+                f'REFERENCES "{ref_table}" ("{ref_column}") DEFERRABLE INITIALLY DEFERRED'
+            )
+            cursor.execute(f'CREATE INDEX "{table}_{fk_column}_idx" ON "{table}" ("{fk_column}")')
+        cursor.execute(f'CREATE INDEX "{table}_{column}_idx" ON "{table}" ("{column}")')
+
+        today = date.today()
+        month = _month_start(first.date()) if first else _month_start(today)
+        end = _add_months(_month_start(max(last.date(), today) if last else today), months_ahead)
+        while month <= end:
+            create_partition(cursor, table, month)
+            month = _add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{legacy}"')
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('\"{table}\"', '{pk}'), "
+            f'COALESCE((SELECT max("{pk}") FROM "{table}"), 0) + 1, false)'
+        )
+        cursor.execute(f'DROP TABLE "{legacy}"')
+
@@ -0,0 +1,300 @@
+"""Fan-out of Job postings to external job boards.
+
+Deliveries are planned synchronously against the database, sent
+concurrently with asyncio (each board limited by its own semaphore and
+retried with backoff), and the outcomes written back as PublishDelivery
+rows. A board that already holds a job receives only the fields that
+changed since its last successful delivery.
+
+Only one publisher runs at a time (``publisher_lock``), so deliveries for a
+job are never planned or recorded concurrently and a board's
+``max_concurrency`` holds across all workers. Rather than trusting that
+every save queued a task, the publisher works from the database: any job
+saved after the last sync with an active board is pending, which also
+covers saves whose task was lost to a broker outage.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from .models import Job, JobBoard, JobPublication, PublishDelivery
+
+logger = logging.getLogger(__name__)
+
+PUBLISHED_FIELDS = ('title', 'description', 'location', 'status')
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 30.0
+# Key for the PostgreSQL advisory lock held while publishing.
+PUBLISHER_LOCK_ID = 0x6A6F6273
+
+
+def job_fields(job):
+    return {name: getattr(job, name) for name in PUBLISHED_FIELDS}
+
+
+def idempotency_key(job_id, board_id, version, payload):
+    # The publication version makes a re-sent change reuse its key while a
+    # later change back to an earlier value gets a new one.
+    body = json.dumps(payload, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha256(f"{job_id}:{board_id}:{version}:{body}".encode()).hexdigest()
+
+
+def plan_deliveries(job_ids):
+    """Create (or pick up unfinished) PublishDelivery rows for the given jobs."""
+    boards = list(JobBoard.objects.filter(is_active=True))
+    if not boards:
+        return []
+
+    publications = {
+        (p.job_id, p.board_id): p
+        for p in JobPublication.objects.filter(job_id__in=job_ids)
+    }
+    planned = []
+    for job in Job.objects.filter(pk__in=job_ids):
+        fields = job_fields(job)
+        for board in boards:
+            publication = publications.get((job.pk, board.pk))
+            if publication is None:
+                action, payload, version = 'create', fields, 0
+            else:
+                payload = {k: v for k, v in fields.items() if publication.published_fields.get(k) != v}
+                if not payload:
+                    _mark_synced(job.pk, board.pk, job.updated_at)
+                    continue
+                action, version = 'update', publication.version
+
+            delivery, created = PublishDelivery.objects.get_or_create(
+                idempotency_key=idempotency_key(job.pk, board.pk, version, payload),
+                defaults={
+                    'job': job, 'board': board, 'action': action, 'payload': payload,
+                    'job_updated_at': job.updated_at,
+                },
+            )
+            if delivery.status == 'Succeeded':
+                _mark_synced(job.pk, board.pk, job.updated_at)
+                continue
+            if not created:
+                delivery.job_updated_at = job.updated_at
+                delivery.save(update_fields=['job_updated_at'])
+            # Unfinished deliveries of older content would overwrite this one
+            # if retried; the new delivery carries everything still unsent.
+            (
+                PublishDelivery.objects
+                .filter(job=job, board=board, status__in=['Pending', 'Failed'])
+                .exclude(pk=delivery.pk)
+                .update(status='Superseded')
+            )
+            planned.append((delivery, board))
+    return planned
+
+
+def _mark_synced(job_id, board_id, updated_at):
+    (
+        JobPublication.objects
+        .filter(job_id=job_id, board_id=board_id)
+        .exclude(synced_at__gte=updated_at)
+        .update(synced_at=updated_at)
+    )
+
+
+def _backoff(attempt, response=None):
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF_SECONDS)
+    return min(0.5 * 2 ** attempt, MAX_BACKOFF_SECONDS)
+
+
+async def _deliver(client, semaphore, delivery, board):
+    import httpx
+
+    base = board.endpoint_url.rstrip('/')
+    if delivery.action == 'create':
+        method, url = 'POST', f"{base}/jobs"
+        body = {'external_id': delivery.job_id, **delivery.payload}
+    else:
+        method, url = 'PATCH', f"{base}/jobs/{delivery.job_id}"
+        body = delivery.payload
+
+    headers = {'Idempotency-Key': delivery.idempotency_key}
+    if board.api_key:
+        headers['Authorization'] = f"Bearer {board.api_key}"
+
+    result = {'attempts': delivery.attempts, 'response_status': None, 'error': ''}
+    for attempt in range(board.max_retries + 1):
+        response = None
+        async with semaphore:
+            result['attempts'] += 1
+            try:
+                response = await client.request(
+                    method, url, json=body, headers=headers, timeout=board.timeout_seconds,
+                )
+            except httpx.TransportError as exc:
+                result['error'] = f"{type(exc).__name__}: {exc}"
+            else:
+                result['response_status'] = response.status_code
+                if response.is_success:
+                    result['error'] = ''
+                    return delivery, True, result
+                result['error'] = response.text[:1000]
+                if response.status_code not in RETRY_STATUSES:
+                    return delivery, False, result
+
+        if attempt < board.max_retries:
+            await asyncio.sleep(_backoff(attempt, response))
+
+    return delivery, False, result
+
+
+async def deliver_all(planned):
+    """Send planned deliveries concurrently, bounded per board."""
+    import httpx
+
+    semaphores = {}
+    async with httpx.AsyncClient() as client:
+        coroutines = []
+        for delivery, board in planned:
+            semaphore = semaphores.setdefault(board.pk, asyncio.Semaphore(max(board.max_concurrency, 1)))
+            coroutines.append(_deliver(client, semaphore, delivery, board))
+        return await asyncio.gather(*coroutines)
+
+
+def record_results(results):
+    for delivery, ok, result in results:
+        with transaction.atomic():
+            delivery.attempts = result['attempts']
+            delivery.response_status = result['response_status']
+            delivery.last_error = result['error']
+            delivery.status = 'Succeeded' if ok else 'Failed'
+            if ok:
+                delivery.delivered_at = timezone.now()
+            delivery.save()
+
+            if ok:
+                publication, _ = JobPublication.objects.select_for_update().get_or_create(
+                    job_id=delivery.job_id, board_id=delivery.board_id,
+                )
+                publication.published_fields = {**publication.published_fields, **delivery.payload}
+                publication.version += 1
+                if delivery.job_updated_at and (
+                    publication.synced_at is None or publication.synced_at < delivery.job_updated_at
+                ):
+                    publication.synced_at = delivery.job_updated_at
+                publication.save()
+            else:
+                logger.warning(
+                    "Publishing job %s to board %s failed after %s attempts: %s",
+                    delivery.job_id, delivery.board_id, delivery.attempts, delivery.last_error,
+                )
+
+
+def publish_jobs(job_ids):
+    """Publish the given jobs to every active board. Returns the deliveries attempted.
+
+    Callers must hold ``publisher_lock``; see ``publish_pending``.
+    """
+    planned = plan_deliveries(job_ids)
+    if not planned:
+        return []
+    results = asyncio.run(deliver_all(planned))
+    record_results(results)
+    return [delivery for delivery, _, _ in results]
+
+
+@contextmanager
+def publisher_lock():
+    """Try to take the cluster-wide publisher lock; yields whether it was taken.
+
+    A session-level advisory lock, so it is released if the worker dies. On
+    other backends (SQLite in development) there is only one process and the
+    lock is always granted.
+    """
+    if connection.vendor != 'postgresql':
+        yield True
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_try_advisory_lock(%s)', [PUBLISHER_LOCK_ID])
+        acquired = cursor.fetchone()[0]
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_unlock(%s)', [PUBLISHER_LOCK_ID])
+
+
+def pending_jobs(limit):
+    """Return ``(job_id, updated_at)`` for jobs saved since their last sync with an active board.
+
+    Jobs whose latest content already failed on that board are left to
+    ``publish_pending(retry_failed=True)`` so they honour the attempt cap.
+    """
+    pending = {}
+    for board in JobBoard.objects.filter(is_active=True):
+        synced = JobPublication.objects.filter(
+            job=OuterRef('pk'), board=board, synced_at__gte=OuterRef('updated_at'),
+        )
+        failed = PublishDelivery.objects.filter(
+            job=OuterRef('pk'), board=board, status='Failed', job_updated_at__gte=OuterRef('updated_at'),
+        )
+        jobs = (
+            Job.objects
+            .exclude(Exists(synced))
+            .exclude(Exists(failed))
+            .order_by('updated_at')
+            .values_list('pk', 'updated_at')[:limit]
+        )
+        pending.update(jobs)
+    return sorted(pending.items(), key=lambda item: item[1])[:limit]
+
+
+def _retryable_job_ids(max_attempts=None):
+    if max_attempts is None:
+        max_attempts = getattr(settings, 'JOB_PUBLISHING_MAX_ATTEMPTS', 20)
+    return set(
+        PublishDelivery.objects
+        .filter(status='Failed', attempts__lt=max_attempts, board__is_active=True)
+        .values_list('job_id', flat=True)
+    )
+
+
+def publish_pending(retry_failed=False, batch_size=100):
+    """Publish every pending job, ``batch_size`` jobs at a time. Returns the deliveries attempted.
+
+    With ``retry_failed`` jobs with failed deliveries below
+    ``JOB_PUBLISHING_MAX_ATTEMPTS`` are re-planned too. If another worker
+    holds the publisher lock this returns at once: that worker checks for
+    pending jobs again after releasing the lock, so a job saved before this
+    call is never left behind.
+    """
+    retry_ids = _retryable_job_ids() if retry_failed else set()
+    attempted = []
+    # A job is tried at most once per save here, so one that cannot be
+    # synced (e.g. its board vanished mid-run) does not loop forever.
+    seen = set()
+
+    def unseen(limit):
+        return [item for item in pending_jobs(limit + len(seen)) if item not in seen][:limit]
+
+    while True:
+        with publisher_lock() as acquired:
+            if not acquired:
+                return attempted
+            while True:
+                batch = unseen(batch_size)
+                job_ids = retry_ids | {job_id for job_id, _ in batch}
+                if not job_ids:
+                    break
+                seen.update(batch)
+                retry_ids = set()
+                attempted += publish_jobs(job_ids)
+        if not unseen(1):
+            return attempted
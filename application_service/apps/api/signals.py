@@ -0,0 +1,118 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from . import changefeed
+from .models import Application, Job, Note, StageTransition, Task
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(pre_save, sender=Application)
+def snapshot_stage_state(sender, instance, raw=False, **kwargs):
+    """Read the persisted stage/status for instances that were not fully loaded
+    (deferred fields, built by hand with a pk) so no change is mistaken for a submission."""
+    if raw or instance.pk is None or hasattr(instance, '_loaded_state'):
+        return
+    row = (
+        Application.objects.filter(pk=instance.pk)
+        .values_list('current_stage', 'status')
+        .first()
+    )
+    if row is not None:
+        instance._loaded_state = row
+
+
+@receiver(post_save, sender=Application)
+def record_stage_transition(sender, instance, created, raw=False, **kwargs):
+    """Append a StageTransition and publish a change-feed delta whenever an
+    Application is created or moves stage/status.
+
+    ``QuerySet.update()`` bypasses this; bulk moves must write transitions themselves.
+    """
+    if raw:
+        return
+
+    if created:
+        from_stage, from_status = None, None
+    else:
+        from_stage, from_status = instance._loaded_state
+        if from_stage == instance.current_stage and from_status == instance.status:
+            return
+
+    StageTransition.objects.create(
+        application=instance,
+        job_id=instance.job_id,
+        from_stage=from_stage,
+        to_stage=instance.current_stage,
+        from_status=from_status,
+        to_status=instance.status,
+        is_submission=created,
+        applied_at=instance.applied_at,
+    )
+    instance._loaded_state = (instance.current_stage, instance.status)
+
+    changefeed.publish_change(instance.job_id, 'application', instance.pk, {
+        'candidate_id': instance.candidate_id,
+        'current_stage': instance.current_stage,
+        'status': instance.status,
+    })
+
+
+def _job_id_for(instance):
+    """Job of a Note/Task's application, without loading the application row."""
+    if type(instance).application.is_cached(instance):
+        return instance.application.job_id
+    return Application.objects.filter(pk=instance.application_id).values_list('job_id', flat=True).first()
+
+
+@receiver(post_save, sender=Note)
+def publish_note_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    changefeed.publish_change(_job_id_for(instance), 'note', instance.pk, {
+        'application_id': instance.application_id,
+        'user_id': instance.user_id,
+        'created_at': instance.created_at,
+    })
+
+
+@receiver(post_save, sender=Task)
+def publish_task_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    changefeed.publish_change(_job_id_for(instance), 'task', instance.pk, {
+        'application_id': instance.application_id,
+        'assigned_to_user_id': instance.assigned_to_user_id,
+        'due_date': instance.due_date,
+        'completed': instance.completed,
+    })
+
+
+@receiver(post_save, sender=Job)
+def schedule_job_publishing(sender, instance, raw=False, **kwargs):
+    """Queue delivery to the job boards once the save has committed.
+
+    The Job is already saved by then, so a broker outage is logged rather
+    than failing the request; the job stays pending and the next publisher
+    run, at the latest retry_failed_publications, delivers it.
+    """
+    if raw or not getattr(settings, 'JOB_PUBLISHING_ENABLED', True):
+        return
+
+    job_id = instance.pk
+
+    def enqueue():
+        from kombu.exceptions import OperationalError
+
+        from .tasks import publish_job
+
+        try:
+            publish_job.delay(job_id)
+        except OperationalError:
+            logger.exception("Could not queue publishing for job %s", job_id)
+
+    transaction.on_commit(enqueue)
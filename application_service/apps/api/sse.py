@@ -0,0 +1,116 @@
+"""Server-sent events endpoint for per-job pipeline changes.
+
+Served directly as an ASGI application in front of Django so a client
+disconnect is noticed immediately and the stream torn down; Django 4.2's
+streaming responses do not observe ``http.disconnect``.
+"""
+import asyncio
+import json
+import re
+from http.cookies import SimpleCookie
+from importlib import import_module
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .changefeed import broadcaster, next_batch
+
+PATH_RE = re.compile(r'^/api/v1/events/jobs/(?P<job_id>\d+)/$')
+
+
+@sync_to_async
+def _authorize(scope, job_id):
+    from .models import Job
+
+    headers = dict(scope.get('headers') or [])
+    cookie = SimpleCookie(headers.get(b'cookie', b'').decode('latin-1'))
+    morsel = cookie.get(settings.SESSION_COOKIE_NAME)
+    if morsel is None:
+        return 401
+
+    engine = import_module(settings.SESSION_ENGINE)
+    user = get_user(SimpleNamespace(session=engine.SessionStore(morsel.value)))
+    if not user.is_authenticated:
+        return 401
+    if not Job.objects.filter(pk=job_id).exists():
+        return 404
+    return 200
+
+
+def _event(name, data):
+    return f"event: {name}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n".encode()
+
+
+async def _respond(send, status, body):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json')],
+    })
+    await send({'type': 'http.response.body', 'body': json.dumps(body).encode()})
+
+
+async def job_events(scope, receive, send, job_id):
+    if scope['method'] != 'GET':
+        return await _respond(send, 405, {'detail': 'Method not allowed.'})
+
+    status = await _authorize(scope, job_id)
+    if status != 200:
+        return await _respond(send, status, {'detail': 'Not found.' if status == 404 else 'Authentication required.'})
+
+    window = getattr(settings, 'CHANGEFEED_COALESCE_SECONDS', 0.5)
+    heartbeat = getattr(settings, 'CHANGEFEED_HEARTBEAT_SECONDS', 15)
+    subscription = broadcaster.subscribe(job_id)
+
+    async def stream():
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': _event('ready', {'job_id': job_id}), 'more_body': True})
+        while True:
+            batch = await next_batch(subscription, window, heartbeat)
+            if subscription.overflowed:
+                subscription.overflowed = False
+                chunk = _event('resync', {'job_id': job_id})
+            elif batch is None:
+                chunk = b': keep-alive\n\n'
+            else:
+                chunk = _event('changes', batch)
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+
+    async def wait_for_disconnect():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+    streamer = asyncio.ensure_future(stream())
+    watcher = asyncio.ensure_future(wait_for_disconnect())
+    try:
+        await asyncio.wait({streamer, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        broadcaster.unsubscribe(subscription)
+        for task in (streamer, watcher):
+            task.cancel()
+        await asyncio.gather(streamer, watcher, return_exceptions=True)
+
+
+class EventStreamMiddleware:
+    """Route the change-feed path to the SSE handler and everything else to Django."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            match = PATH_RE.match(scope['path'])
+            if match:
+                return await job_events(scope, receive, send, int(match['job_id']))
+        return await self.app(scope, receive, send)
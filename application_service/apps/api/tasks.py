@@ -0,0 +1,37 @@
+from config.celery import app
+
+from . import partitioning
+from .analytics import refresh_rollups
+from .archive import archive_applications
+from .publishing import publish_pending
+
+
+@app.task
+def refresh_analytics_rollups():
+    return refresh_rollups()
+
+
+@app.task
+def ensure_communication_partitions():
+    return {
+        table: partitioning.ensure_partitions(table)
+        for table in partitioning.PARTITIONED_TABLES
+        if partitioning.is_partitioned(table)
+    }
+
+
+@app.task
+def archive_closed_applications():
+    return archive_applications()
+
+
+@app.task
+def publish_job(job_id):
+    # The saved job is pending in the database, so publish_pending picks it
+    # up (along with anything else waiting); job_id only names the trigger.
+    return [delivery.delivery_id for delivery in publish_pending()]
+
+
+@app.task
+def retry_failed_publications():
+    return [delivery.delivery_id for delivery in publish_pending(retry_failed=True)]
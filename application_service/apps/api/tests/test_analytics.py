@@ -0,0 +1,143 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.api.analytics import refresh_rollups
+from apps.api.models import (
+    Application,
+    DailyApplicationRollup,
+    DailyStageConversionRollup,
+    RollupCheckpoint,
+    StageTransition,
+)
+
+from .utils import RecruiterJobMixin, make_application
+
+
+class AnalyticsTestMixin(RecruiterJobMixin):
+    def apply(self, n):
+        return make_application(self.job, n)
+
+
+class StageTransitionSignalTests(AnalyticsTestMixin, TestCase):
+    def test_create_records_submission(self):
+        application = self.apply(1)
+
+        transition = StageTransition.objects.get(application=application)
+        self.assertTrue(transition.is_submission)
+        self.assertIsNone(transition.from_stage)
+        self.assertEqual(transition.to_stage, 'Screening')
+        self.assertEqual(transition.to_status, 'New')
+
+    def test_stage_change_records_transition(self):
+        application = Application.objects.get(pk=self.apply(1).pk)
+        application.current_stage = 'Offer'
+        application.save()
+
+        transition = StageTransition.objects.filter(application=application).last()
+        self.assertFalse(transition.is_submission)
+        self.assertEqual((transition.from_stage, transition.to_stage), ('Screening', 'Offer'))
+
+    def test_unchanged_saves_record_nothing(self):
+        application = self.apply(1)
+        application.save()
+        Application.objects.only('job').get(pk=application.pk).save()
+        application.refresh_from_db()
+        application.save()
+        Application(
+            pk=application.pk, job=self.job, candidate=application.candidate,
+            current_stage='Screening', status='New', applied_at=application.applied_at,
+        ).save()
+
+        self.assertEqual(StageTransition.objects.filter(application=application).count(), 1)
+
+
+@override_settings(ANALYTICS_ROLLUP_SETTLE_SECONDS=-1)
+class RefreshRollupsTests(AnalyticsTestMixin, TestCase):
+    def test_refreshes_are_incremental(self):
+        first = self.apply(1)
+        first.current_stage = 'Offer'
+        first.status = 'Hired'
+        first.save()
+        self.assertEqual(refresh_rollups(), 2)
+
+        second = self.apply(2)
+        second.current_stage = 'Offer'
+        second.save()
+        self.assertEqual(refresh_rollups(), 2)
+        self.assertEqual(refresh_rollups(), 0)
+
+        totals = DailyApplicationRollup.objects.get(job=self.job)
+        self.assertEqual((totals.applications, totals.hires), (2, 1))
+        conversions = set(
+            DailyStageConversionRollup.objects.filter(job=self.job)
+            .values_list('from_stage', 'to_stage', 'transitions')
+        )
+        self.assertEqual(conversions, {('', 'Screening', 2), ('Screening', 'Offer', 2)})
+
+    def test_checkpoint_stops_at_unsettled_transition(self):
+        older, newer = self.apply(1), self.apply(2)
+        now = timezone.now()
+        StageTransition.objects.filter(application=older).update(transitioned_at=now + timedelta(minutes=5))
+        StageTransition.objects.filter(application=newer).update(transitioned_at=now - timedelta(minutes=5))
+
+        self.assertEqual(refresh_rollups(), 0)
+        self.assertFalse(RollupCheckpoint.objects.filter(last_transition_id__gt=0).exists())
+
+
+class AnalyticsViewTests(AnalyticsTestMixin, TestCase):
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def seed(self):
+        """Three applications reach Screening, two move on to Offer and one of
+        those is hired ten days after applying."""
+        applications = [self.apply(n) for n in range(3)]
+        Application.objects.filter(pk=applications[0].pk).update(applied_at=timezone.now() - timedelta(days=10))
+        for application in applications[:2]:
+            application.refresh_from_db()
+            application.current_stage = 'Offer'
+            if application is applications[0]:
+                application.status = 'Hired'
+            application.save()
+        with override_settings(ANALYTICS_ROLLUP_SETTLE_SECONDS=-1):
+            refresh_rollups()
+
+    def get(self, name):
+        response = self.client.get(f'/api/v1/analytics/jobs/{self.job.pk}/{name}/')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_applications_per_day(self):
+        self.seed()
+        self.assertEqual(self.get('applications-per-day')['results'], [
+            {'day': timezone.localdate().isoformat(), 'applications': 3, 'hires': 1},
+        ])
+
+    def test_stage_conversion_rate_uses_entries_into_from_stage(self):
+        self.seed()
+        self.assertEqual(self.get('stage-conversion')['results'], [
+            {'from_stage': None, 'to_stage': 'Screening', 'transitions': 3, 'conversion_rate': None},
+            {'from_stage': 'Screening', 'to_stage': 'Offer', 'transitions': 2, 'conversion_rate': 0.6667},
+        ])
+
+    def test_time_to_hire(self):
+        self.seed()
+        data = self.get('time-to-hire')
+        self.assertEqual(data['hires'], 1)
+        self.assertEqual(data['average_seconds_to_hire'], 10 * 86400)
+        self.assertEqual(data['average_days_to_hire'], 10.0)
+
+    def test_time_to_hire_without_hires(self):
+        data = self.get('time-to-hire')
+        self.assertEqual((data['hires'], data['average_days_to_hire']), (0, None))
+
+    def test_date_range_bounds(self):
+        for name in ('applications-per-day', 'stage-conversion', 'time-to-hire'):
+            url = f'/api/v1/analytics/jobs/{self.job.pk}/{name}/'
+            with self.subTest(name=name):
+                self.assertEqual(self.client.get(url).status_code, 200)
+                self.assertEqual(self.client.get(url, {'start': 'yesterday'}).status_code, 400)
+                self.assertEqual(self.client.get(url, {'start': '2024-02-01', 'end': '2024-01-01'}).status_code, 400)
+                self.assertEqual(self.client.get(url, {'start': '2022-01-01', 'end': '2024-01-01'}).status_code, 400)
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.api.archive import archive_applications
+from apps.api.models import Application, ArchivedApplication, Job, Note, StageTransition
+
+from .utils import RecruiterJobMixin, make_application, make_job
+
+
+class ArchiveApplicationsTests(RecruiterJobMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.archived_job = make_job(cls.user, title='Old role', status='Archived')
+        Job.objects.filter(pk=cls.archived_job.pk).update(archived_at=timezone.now() - timedelta(days=31 * 13))
+        cls.recently_archived_job = make_job(cls.user, title='Filled role', status='Archived')
+        cls.active_job = cls.job
+
+    def apply(self, job, n, months_ago):
+        application = make_application(job, n)
+        Application.objects.filter(pk=application.pk).update(
+            applied_at=timezone.now() - timedelta(days=31 * months_ago),
+        )
+        return application
+
+    def test_moves_applications_of_long_archived_jobs(self):
+        old = self.apply(self.archived_job, 1, months_ago=14)
+        Note.objects.create(application=old, user=self.user, content='Strong systems background')
+        late = self.apply(self.archived_job, 2, months_ago=1)
+        recently_archived = self.apply(self.recently_archived_job, 3, months_ago=14)
+        active = self.apply(self.active_job, 4, months_ago=14)
+
+        self.assertEqual(archive_applications(months=12), 2)
+
+        for application in (old, late):
+            self.assertFalse(Application.objects.filter(pk=application.pk).exists())
+        self.assertFalse(Note.objects.filter(application_id=old.pk).exists())
+        self.assertFalse(StageTransition.objects.filter(application_id=old.pk).exists())
+        self.assertEqual(Application.objects.filter(pk__in=[recently_archived.pk, active.pk]).count(), 2)
+        self.assertEqual(
+            set(ArchivedApplication.objects.values_list('application_id', flat=True)),
+            {old.pk, late.pk},
+        )
+
+    def test_job_save_tracks_archival_time(self):
+        job = make_job(self.user)
+        self.assertIsNone(job.archived_at)
+
+        job.status = 'Archived'
+        job.save(update_fields=['status'])
+        job.refresh_from_db()
+        self.assertIsNotNone(job.archived_at)
+
+        job.status = 'Active'
+        job.save()
+        job.refresh_from_db()
+        self.assertIsNone(job.archived_at)
+
+    def test_archived_application_is_served_from_cold_storage(self):
+        old = self.apply(self.archived_job, 1, months_ago=13)
+        Note.objects.create(application=old, user=self.user, content='Strong systems background')
+        archive_applications(months=12)
+
+        self.client.force_login(self.user)
+        response = self.client.get(f'/api/v1/applications/{old.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['archived'])
+        self.assertEqual(data['application_id'], old.pk)
+        self.assertEqual(data['current_stage'], 'Screening')
+        self.assertEqual([note['content'] for note in data['notes']], ['Strong systems background'])
+        self.assertEqual(len(data['stage_transitions']), 1)
+
+    def test_missing_application_is_404(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get('/api/v1/applications/999/').status_code, 404)
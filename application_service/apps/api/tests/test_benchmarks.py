@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase
+
+from apps.api.benchmarks.compare import compare, timings_comparable
+
+
+def results(python='3.11.7', database='sqlite', queries=1, median_ms=1.0, errors=0):
+    return {
+        'meta': {'python': python, 'database': database},
+        'queries': {'job_applications_page': {'queries': queries, 'median_ms': median_ms}},
+        'load': {'endpoints': {'health': {'errors': errors, 'p95_ms': median_ms}}},
+    }
+
+
+class CompareTests(SimpleTestCase):
+    def test_query_count_increase_always_regresses(self):
+        self.assertEqual(len(compare(results(queries=2), results(), 0.25, timings=False)), 1)
+
+    def test_failed_requests_always_regress(self):
+        self.assertEqual(len(compare(results(errors=3), results(), 0.25, timings=False)), 1)
+
+    def test_timings_gated_by_threshold(self):
+        self.assertEqual(compare(results(median_ms=10.0), results(), 0.25, timings=False), [])
+        self.assertEqual(len(compare(results(median_ms=10.0), results(), 0.25)), 2)
+        self.assertEqual(compare(results(median_ms=1.2), results(), 0.25), [])
+
+    def test_timings_comparable_only_on_same_environment(self):
+        self.assertTrue(timings_comparable(results(python='3.11.2'), results()))
+        self.assertFalse(timings_comparable(results(python='3.9.18'), results()))
+        self.assertFalse(timings_comparable(results(database='postgresql'), results()))
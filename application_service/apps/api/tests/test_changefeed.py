@@ -0,0 +1,184 @@
+import asyncio
+import json
+from unittest import mock
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.api import changefeed
+from apps.api.models import Application, Note, Task
+from apps.api.sse import EventStreamMiddleware
+
+from .utils import RecruiterJobMixin, make_application
+
+
+def delta(kind, pk, **fields):
+    return {'type': kind, 'id': pk, 'fields': fields}
+
+
+class CoalesceTests(SimpleTestCase):
+    def test_merges_deltas_per_object_keeping_order(self):
+        merged = changefeed.coalesce([
+            delta('application', 1, status='New'),
+            delta('note', 7, user_id=2),
+            delta('application', 1, status='Hired', current_stage='Offer'),
+        ])
+        self.assertEqual(merged, [
+            delta('application', 1, status='Hired', current_stage='Offer'),
+            delta('note', 7, user_id=2),
+        ])
+
+    async def test_next_batch_collects_within_window(self):
+        subscription = changefeed.Subscription(job_id=1, maxsize=10)
+        subscription.put(delta('task', 3, completed=False))
+        subscription.put(delta('task', 3, completed=True))
+
+        batch = await changefeed.next_batch(subscription, window=0, heartbeat=1)
+
+        self.assertEqual(batch, [delta('task', 3, completed=True)])
+
+    async def test_next_batch_returns_none_on_heartbeat(self):
+        subscription = changefeed.Subscription(job_id=1, maxsize=10)
+        self.assertIsNone(await changefeed.next_batch(subscription, window=0, heartbeat=0.01))
+
+    def test_full_queue_marks_overflow(self):
+        subscription = changefeed.Subscription(job_id=1, maxsize=1)
+        subscription.put(delta('note', 1))
+        subscription.put(delta('note', 2))
+        self.assertTrue(subscription.overflowed)
+
+
+@override_settings(CHANGEFEED_ENABLED=True, JOB_PUBLISHING_ENABLED=False)
+class PublishChangeSignalTests(RecruiterJobMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.application = make_application(cls.job, 1)
+
+    def setUp(self):
+        patcher = mock.patch('apps.api.changefeed._get_client')
+        self.client_factory = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.redis = self.client_factory.return_value
+
+    def published(self):
+        return [
+            (channel, json.loads(message))
+            for (channel, message), _ in self.redis.publish.call_args_list
+        ]
+
+    def test_nothing_is_published_before_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            Note.objects.create(application=self.application, user=self.user, content='Call back')
+        self.assertEqual(len(callbacks), 1)
+        self.redis.publish.assert_not_called()
+
+    def test_application_stage_and_status_change(self):
+        application = Application.objects.get(pk=self.application.pk)
+        application.current_stage = 'Offer'
+        application.status = 'Hired'
+        with self.captureOnCommitCallbacks(execute=True):
+            application.save()
+
+        self.assertEqual(self.published(), [(f'pipeline:job:{self.job.pk}', delta(
+            'application', application.pk,
+            candidate_id=application.candidate_id, current_stage='Offer', status='Hired',
+        ))])
+
+    def test_unchanged_application_publishes_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Application.objects.get(pk=self.application.pk).save()
+        self.redis.publish.assert_not_called()
+
+    def test_note_with_cached_application(self):
+        application = Application.objects.get(pk=self.application.pk)
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks(execute=True):
+            note = Note.objects.create(application=application, user=self.user, content='Call back')
+
+        self.assertEqual(self.published(), [(f'pipeline:job:{self.job.pk}', delta(
+            'note', note.pk,
+            application_id=application.pk, user_id=self.user.pk,
+            created_at=DjangoJSONEncoder().default(note.created_at),
+        ))])
+
+    def test_task_without_cached_application(self):
+        # Looking up the job costs one query on top of the insert.
+        with self.assertNumQueries(2), self.captureOnCommitCallbacks(execute=True):
+            task = Task.objects.create(
+                application_id=self.application.pk, assigned_to_user=self.user, description='Schedule interview',
+            )
+        task.completed = True
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+
+        self.assertEqual(self.published(), [
+            (f'pipeline:job:{self.job.pk}', delta(
+                'task', task.pk,
+                application_id=self.application.pk, assigned_to_user_id=self.user.pk,
+                due_date=None, completed=completed,
+            ))
+            for completed in (False, True)
+        ])
+
+
+async def _idle():
+    await asyncio.Event().wait()
+
+
+@override_settings(CHANGEFEED_COALESCE_SECONDS=0, CHANGEFEED_HEARTBEAT_SECONDS=5)
+class JobEventsTests(RecruiterJobMixin, TestCase):
+    def setUp(self):
+        self.broadcaster = changefeed.Broadcaster()
+        patcher = mock.patch('apps.api.sse.broadcaster', self.broadcaster)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.broadcaster._run = _idle
+        self.app = EventStreamMiddleware(None)
+        self.client.force_login(self.user)
+        self.cookie = self.client.cookies['sessionid'].value
+
+    async def request(self, job_id, cookie=None, until=None):
+        headers = [(b'cookie', f'sessionid={cookie}'.encode())] if cookie else []
+        scope = {'type': 'http', 'method': 'GET', 'path': f'/api/v1/events/jobs/{job_id}/', 'headers': headers}
+        messages, inbox = [], asyncio.Queue()
+
+        async def send(message):
+            messages.append(message)
+
+        task = asyncio.ensure_future(self.app(scope, inbox.get, send))
+        if until is not None:
+            await until(messages)
+            await inbox.put({'type': 'http.disconnect'})
+        await asyncio.wait_for(task, timeout=5)
+        return messages
+
+    async def test_requires_session(self):
+        messages = await self.request(self.job.pk)
+        self.assertEqual(messages[0]['status'], 401)
+
+    async def test_unknown_job_is_404(self):
+        messages = await self.request(self.job.pk + 100, self.cookie)
+        self.assertEqual(messages[0]['status'], 404)
+
+    async def test_streams_coalesced_changes(self):
+        job_id = self.job.pk
+
+        async def publish_then_wait(messages):
+            while len(messages) < 2:
+                await asyncio.sleep(0.01)
+            for status in ('Interview', 'Hired'):
+                self.broadcaster.dispatch(
+                    changefeed.channel_for_job(job_id), json.dumps(delta('application', 5, status=status)),
+                )
+            while len(messages) < 3:
+                await asyncio.sleep(0.01)
+
+        messages = await self.request(job_id, self.cookie, until=publish_then_wait)
+
+        self.assertEqual(messages[0]['status'], 200)
+        self.assertEqual(messages[1]['body'], f'event: ready\ndata: {{"job_id": {job_id}}}\n\n'.encode())
+        self.assertEqual(
+            messages[2]['body'],
+            b'event: changes\ndata: [{"type": "application", "id": 5, "fields": {"status": "Hired"}}]\n\n',
+        )
+        self.assertEqual(self.broadcaster.subscribers, {})
@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.api import partitioning
+from apps.api.models import Email, Note
+
+from .utils import RecruiterJobMixin, make_application
+
+
+def partitions(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s",
+            [table],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+# DDL is transactional on PostgreSQL, so each test's conversion is rolled back.
+@skipUnless(connection.vendor == 'postgresql', 'Table partitioning requires PostgreSQL')
+class PartitioningTests(RecruiterJobMixin, TestCase):
+    def setUp(self):
+        self.application = make_application(self.job, 1)
+        self.emails = [
+            Email.objects.create(
+                application=self.application, sender_user=self.user,
+                recipient_email='ada1@example.com', subject=f'Update {n}', content='Hello',
+            )
+            for n in range(3)
+        ]
+        self.notes = [Note.objects.create(application=self.application, user=self.user, content='Call back')]
+        # Spread the emails over three months, the oldest two months back.
+        for months_ago, email in enumerate(self.emails):
+            Email.objects.filter(pk=email.pk).update(sent_at=timezone.now() - timedelta(days=31 * months_ago))
+        self.oldest = partitioning._month_start((timezone.now() - timedelta(days=62)).date())
+
+    def test_convert_keeps_rows_and_resets_identity(self):
+        self.assertFalse(partitioning.is_partitioned('emails'))
+
+        partitioning.convert_to_partitioned('emails', months_ahead=2)
+
+        self.assertTrue(partitioning.is_partitioned('emails'))
+        self.assertEqual(
+            set(Email.objects.values_list('pk', flat=True)),
+            {email.pk for email in self.emails},
+        )
+        self.assertIn(partitioning.partition_name('emails', self.oldest), partitions('emails'))
+        self.assertEqual(Email.objects.filter(application=self.application).count(), 3)
+
+        email = Email.objects.create(
+            application=self.application, sender_user=self.user,
+            recipient_email='ada1@example.com', subject='After conversion', content='Hello',
+        )
+        self.assertGreater(email.pk, max(e.pk for e in self.emails))
+
+    def test_convert_notes(self):
+        partitioning.convert_to_partitioned('notes')
+
+        self.assertTrue(partitioning.is_partitioned('notes'))
+        self.assertEqual(list(Note.objects.values_list('pk', flat=True)), [self.notes[0].pk])
+        note = Note.objects.create(application=self.application, user=self.user, content='Offer sent')
+        self.assertGreater(note.pk, self.notes[0].pk)
+
+    def test_ensure_partitions_creates_months_ahead(self):
+        partitioning.convert_to_partitioned('emails', months_ahead=0)
+        today = date.today()
+
+        created = partitioning.ensure_partitions('emails', months_ahead=4, today=today)
+
+        expected = [
+            partitioning.partition_name('emails', partitioning._add_months(partitioning._month_start(today), i))
+            for i in range(5)
+        ]
+        self.assertEqual(created, expected)
+        self.assertTrue(set(expected) <= partitions('emails'))
+        # Running it again is a no-op.
+        self.assertEqual(partitioning.ensure_partitions('emails', months_ahead=4, today=today), expected)
@@ -0,0 +1,134 @@
+import threading
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.api.management.commands.run_fake_job_board import FakeJobBoard
+from apps.api.models import Job, JobBoard, JobPublication, PublishDelivery
+from apps.api.publishing import pending_jobs, plan_deliveries, publish_jobs, publish_pending
+
+from .utils import RecruiterJobMixin
+
+
+@mock.patch('apps.api.publishing._backoff', return_value=0)
+class PublishJobsTests(RecruiterJobMixin, TestCase):
+    def setUp(self):
+        self.server = FakeJobBoard(('127.0.0.1', 0), failure_rate=0.0, verbose=False)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.board = JobBoard.objects.create(
+            name='Fake board', slug='fake', max_retries=2,
+            endpoint_url=f'http://127.0.0.1:{self.server.server_address[1]}',
+        )
+
+    def test_create_sends_full_fields(self, _):
+        publish_jobs([self.job.pk])
+
+        request = self.server.requests[-1]
+        self.assertEqual((request['method'], request['path']), ('POST', '/jobs'))
+        self.assertEqual(request['body'], {
+            'external_id': self.job.pk,
+            'title': 'Backend Engineer',
+            'description': 'Django and PostgreSQL',
+            'location': 'Remote',
+            'status': 'Active',
+        })
+        self.assertEqual(PublishDelivery.objects.get().status, 'Succeeded')
+
+    def test_update_sends_only_changed_fields(self, _):
+        publish_jobs([self.job.pk])
+        self.job.title = 'Senior Backend Engineer'
+        self.job.save()
+        publish_jobs([self.job.pk])
+
+        request = self.server.requests[-1]
+        self.assertEqual((request['method'], request['path']), ('PATCH', f'/jobs/{self.job.pk}'))
+        self.assertEqual(request['body'], {'title': 'Senior Backend Engineer'})
+        self.assertEqual(self.server.jobs[str(self.job.pk)]['title'], 'Senior Backend Engineer')
+
+    def test_retries_reuse_idempotency_key(self, _):
+        self.server.failure_rate = 1.0
+        with self.assertLogs('apps.api.publishing', 'WARNING'):
+            publish_jobs([self.job.pk])
+        delivery = PublishDelivery.objects.get()
+        self.assertEqual((delivery.status, delivery.attempts, delivery.response_status), ('Failed', 3, 503))
+
+        self.server.failure_rate = 0.0
+        self.assertEqual(publish_pending(), [])
+        publish_pending(retry_failed=True)
+
+        delivery.refresh_from_db()
+        self.assertEqual((delivery.status, delivery.attempts), ('Succeeded', 4))
+        self.assertEqual({request['key'] for request in self.server.requests}, {delivery.idempotency_key})
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_unchanged_job_plans_nothing(self, _):
+        publish_jobs([self.job.pk])
+        requests = len(self.server.requests)
+
+        self.assertEqual(plan_deliveries([self.job.pk]), [])
+        self.assertEqual(publish_jobs([self.job.pk]), [])
+        self.assertEqual(len(self.server.requests), requests)
+
+    def test_newer_change_supersedes_failed_delivery(self, _):
+        self.server.failure_rate = 1.0
+        with self.assertLogs('apps.api.publishing', 'WARNING'):
+            publish_jobs([self.job.pk])
+        self.server.failure_rate = 0.0
+        self.job.location = 'Colombo'
+        self.job.save()
+        publish_jobs([self.job.pk])
+
+        self.assertEqual(
+            sorted(PublishDelivery.objects.values_list('status', flat=True)),
+            ['Succeeded', 'Superseded'],
+        )
+        self.assertEqual(self.server.jobs[str(self.job.pk)]['location'], 'Colombo')
+
+    def test_publish_pending_reconciles_unqueued_saves(self, _):
+        publish_pending()
+        self.assertEqual(pending_jobs(10), [])
+
+        # A save whose publish task never reached the broker.
+        Job.objects.filter(pk=self.job.pk).update(location='Colombo', updated_at=timezone.now())
+        self.assertEqual([job_id for job_id, _ in pending_jobs(10)], [self.job.pk])
+        publish_pending()
+
+        request = self.server.requests[-1]
+        self.assertEqual((request['method'], request['body']), ('PATCH', {'location': 'Colombo'}))
+        self.assertEqual(pending_jobs(10), [])
+
+    def test_save_without_published_changes_is_synced_without_delivery(self, _):
+        publish_pending()
+        self.job.save()
+        requests = len(self.server.requests)
+
+        publish_pending()
+
+        self.assertEqual(len(self.server.requests), requests)
+        self.job.refresh_from_db()
+        self.assertEqual(JobPublication.objects.get().synced_at, self.job.updated_at)
+        self.assertEqual(pending_jobs(10), [])
+
+    def test_publish_pending_works_in_batches(self, _):
+        jobs = [self.job] + [
+            Job.objects.create(created_by=self.user, title=f'Role {n}', description='-', location='Remote')
+            for n in range(4)
+        ]
+
+        with mock.patch('apps.api.publishing.publish_jobs', wraps=publish_jobs) as publish:
+            publish_pending(batch_size=2)
+
+        self.assertEqual([len(call.args[0]) for call in publish.call_args_list], [2, 2, 1])
+        self.assertEqual(set(self.server.jobs), {str(job.pk) for job in jobs})
+
+    def test_publish_pending_skips_when_another_worker_publishes(self, _):
+        with mock.patch('apps.api.publishing.publisher_lock') as lock:
+            lock.return_value.__enter__.return_value = False
+            self.assertEqual(publish_pending(), [])
+        self.assertEqual(self.server.requests, [])
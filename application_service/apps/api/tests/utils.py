@@ -0,0 +1,23 @@
+from django.contrib.auth.models import User
+
+from apps.api.models import Application, Candidate, Job
+
+
+def make_job(user, **fields):
+    fields = {'title': 'Backend Engineer', 'description': 'Django and PostgreSQL', 'location': 'Remote', **fields}
+    return Job.objects.create(created_by=user, **fields)
+
+
+def make_application(job, n, **fields):
+    candidate = Candidate.objects.create(first_name='Ada', last_name=str(n), email=f'ada{n}@example.com')
+    return Application.objects.create(job=job, candidate=candidate, **{'current_stage': 'Screening', **fields})
+
+
+class RecruiterJobMixin:
+    """Provides ``self.user`` and an active ``self.job`` created by them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = User.objects.create(username='recruiter')
+        cls.job = make_job(cls.user)
@@ -1,3 +1,9 @@
 from django.urls import path 
+from . import views 
  
-urlpatterns = [] 
+urlpatterns = [ 
+    path('applications/<int:application_id>/', views.application_detail, name='application_detail'), 
+    path('analytics/jobs/<int:job_id>/applications-per-day/', views.applications_per_day, name='analytics_applications_per_day'), 
+    path('analytics/jobs/<int:job_id>/stage-conversion/', views.stage_conversion, name='analytics_stage_conversion'), 
+    path('analytics/jobs/<int:job_id>/time-to-hire/', views.time_to_hire, name='analytics_time_to_hire'), 
+] 
@@ -1 +1,108 @@
-from django.shortcuts import render 
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db.models import Sum
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+
+from .archive import get_application
+from .models import Application, DailyApplicationRollup, DailyStageConversionRollup, Job
+
+
+def _date_range(request):
+    """Parse ``start``/``end`` (YYYY-MM-DD) and bound the window so dashboard
+    queries read a fixed number of rollup rows regardless of history size."""
+    try:
+        end = date.fromisoformat(request.query_params['end']) if 'end' in request.query_params else timezone.localdate()
+        start = date.fromisoformat(request.query_params['start']) if 'start' in request.query_params else end - timedelta(days=29)
+    except ValueError:
+        return None, None, Response({'detail': 'start and end must be YYYY-MM-DD dates.'}, status=400)
+
+    max_days = getattr(settings, 'ANALYTICS_MAX_RANGE_DAYS', 366)
+    if start > end or (end - start).days >= max_days:
+        return None, None, Response(
+            {'detail': f'start must not be after end and the range may span at most {max_days} days.'},
+            status=400,
+        )
+    return start, end, None
+
+
+@api_view(['GET'])
+def applications_per_day(request, job_id):
+    job = get_object_or_404(Job, pk=job_id)
+    start, end, error = _date_range(request)
+    if error:
+        return error
+
+    rows = (
+        DailyApplicationRollup.objects
+        .filter(job=job, day__range=(start, end))
+        .order_by('day')
+        .values('day', 'applications', 'hires')
+    )
+    return Response({'job_id': job.job_id, 'start': start, 'end': end, 'results': list(rows)})
+
+
+@api_view(['GET'])
+def stage_conversion(request, job_id):
+    job = get_object_or_404(Job, pk=job_id)
+    start, end, error = _date_range(request)
+    if error:
+        return error
+
+    pairs = (
+        DailyStageConversionRollup.objects
+        .filter(job=job, day__range=(start, end))
+        .values('from_stage', 'to_stage')
+        .annotate(transitions=Sum('transitions'))
+        .order_by('from_stage', 'to_stage')
+    )
+
+    entered = {}
+    for pair in pairs:
+        entered[pair['to_stage']] = entered.get(pair['to_stage'], 0) + pair['transitions']
+
+    results = []
+    for pair in pairs:
+        base = entered.get(pair['from_stage'], 0)
+        results.append({
+            'from_stage': pair['from_stage'] or None,
+            'to_stage': pair['to_stage'] or None,
+            'transitions': pair['transitions'],
+            'conversion_rate': round(pair['transitions'] / base, 4) if pair['from_stage'] and base else None,
+        })
+    return Response({'job_id': job.job_id, 'start': start, 'end': end, 'results': results})
+
+
+@api_view(['GET'])
+def time_to_hire(request, job_id):
+    job = get_object_or_404(Job, pk=job_id)
+    start, end, error = _date_range(request)
+    if error:
+        return error
+
+    totals = DailyApplicationRollup.objects.filter(job=job, day__range=(start, end)).aggregate(
+        hires=Sum('hires'),
+        total_seconds=Sum('total_seconds_to_hire'),
+    )
+    hires = totals['hires'] or 0
+    average = (totals['total_seconds'] or 0) / hires if hires else None
+    return Response({
+        'job_id': job.job_id,
+        'start': start,
+        'end': end,
+        'hires': hires,
+        'average_seconds_to_hire': average,
+        'average_days_to_hire': round(average / 86400, 2) if average is not None else None,
+    })
+
+
+@api_view(['GET'])
+def application_detail(request, application_id):
+    try:
+        data, archived = get_application(application_id)
+    except Application.DoesNotExist:
+        return Response({'detail': 'Not found.'}, status=404)
+    return Response({**data, 'archived': archived})
@@ -4,4 +4,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.production')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported after Django is set up; the change feed needs settings and models.
+from apps.api.sse import EventStreamMiddleware  # noqa: E402
+
+application = EventStreamMiddleware(django_application)
@@ -0,0 +1,19 @@
+import os
+
+from celery import Celery
+from celery.signals import worker_process_init
+
+# Only the Celery CLI imports this module first; web processes have already
+# chosen their settings by the time tasks are imported.
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.worker')
+
+app = Celery('application_service')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def reset_connections(**kwargs):
+    from config.forksafe import after_fork
+
+    after_fork()
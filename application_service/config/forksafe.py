@@ -0,0 +1,28 @@
+"""Hooks for servers that import the app once and then fork workers.
+
+Sockets opened in the parent must never be used by a child: two processes
+talking over one database or Redis connection corrupt each other's
+protocol state. The parent drops its connections before forking and each
+child starts with fresh clients.
+"""
+from django.db import connections
+
+
+def before_fork():
+    """Run in the parent: close connections opened while loading the app."""
+    connections.close_all()
+
+    from apps.api import changefeed
+
+    changefeed.reset_client()
+
+
+def after_fork():
+    """Run in the child: make sure nothing inherited is reused."""
+    for conn in connections.all():
+        # Forget rather than close: closing would end the parent's session.
+        conn.connection = None
+
+    from apps.api import changefeed
+
+    changefeed.reset_client()
@@ -0,0 +1,20 @@
+from .production import *
+
+# API-only web processes: JSON over REST and the change feed. Admin, flash
+# messages, static files and HTML templates are served elsewhere (or not at all).
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS
+    if app not in ('django.contrib.admin', 'django.contrib.messages', 'django.contrib.staticfiles')
+]
+
+MIDDLEWARE = [
+    middleware for middleware in MIDDLEWARE
+    if middleware != 'django.contrib.messages.middleware.MessageMiddleware'
+]
+
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': ['rest_framework.renderers.JSONRenderer'],
+}
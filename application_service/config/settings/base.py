@@ -123,3 +123,49 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
 ]
+
+# Celery configuration
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'refresh-analytics-rollups': {
+        'task': 'apps.api.tasks.refresh_analytics_rollups',
+        'schedule': 300.0,
+    },
+    'ensure-communication-partitions': {
+        'task': 'apps.api.tasks.ensure_communication_partitions',
+        'schedule': 86400.0,
+    },
+    'archive-closed-applications': {
+        'task': 'apps.api.tasks.archive_closed_applications',
+        'schedule': 86400.0,
+    },
+    'retry-failed-publications': {
+        'task': 'apps.api.tasks.retry_failed_publications',
+        'schedule': 900.0,
+    },
+}
+
+# Analytics rollups
+ANALYTICS_ROLLUP_BATCH_SIZE = 5000
+ANALYTICS_ROLLUP_SETTLE_SECONDS = 60
+ANALYTICS_MAX_RANGE_DAYS = 366
+
+# Applications move to cold storage once their job has been archived this many months
+ARCHIVE_APPLICATIONS_AFTER_MONTHS = int(os.environ.get('ARCHIVE_APPLICATIONS_AFTER_MONTHS', 12))
+
+# Publish jobs to the configured job boards whenever a Job is saved
+JOB_PUBLISHING_ENABLED = os.environ.get('JOB_PUBLISHING_ENABLED', 'True') == 'True'
+# Failed deliveries are retried every 15 minutes until they reach this many attempts
+JOB_PUBLISHING_MAX_ATTEMPTS = 20
+
+# Realtime change feed (Redis pub/sub, served as server-sent events)
+CHANGEFEED_ENABLED = os.environ.get('CHANGEFEED_ENABLED', 'True') == 'True'
+CHANGEFEED_REDIS_URL = os.environ.get('CHANGEFEED_REDIS_URL', 'redis://localhost:6379/1')
+CHANGEFEED_COALESCE_SECONDS = 0.5
+CHANGEFEED_HEARTBEAT_SECONDS = 15
+# Connect/read timeout for publishing from request handlers
+CHANGEFEED_SOCKET_TIMEOUT = 0.5
+
+# Benchmarks: allowed slowdown against the stored baseline before run_benchmarks fails
+BENCHMARK_REGRESSION_THRESHOLD = float(os.environ.get('BENCHMARK_REGRESSION_THRESHOLD', 0.25))
@@ -18,3 +18,6 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 # CORS settings for development
 CORS_ALLOW_ALL_ORIGINS = True
+
+# Run Celery tasks inline so development does not need a broker
+CELERY_TASK_ALWAYS_EAGER = True
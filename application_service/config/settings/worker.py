@@ -0,0 +1,14 @@
+from .production import *
+
+# Celery worker and beat processes: models and tasks only, no HTTP stack.
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'apps.api',
+]
+
+MIDDLEWARE = []
+
+TEMPLATES = []
+
+ROOT_URLCONF = 'config.worker_urls'
@@ -1,8 +1,13 @@
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('health/', include('apps.health.urls')),
     path('api/v1/', include('apps.api.urls')),
 ]
+
+# The api settings profile leaves the admin out.
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
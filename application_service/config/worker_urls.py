@@ -0,0 +1,2 @@
+# Workers serve no HTTP; system checks still load a URLconf, so keep it empty.
+urlpatterns = []
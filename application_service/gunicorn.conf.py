@@ -0,0 +1,46 @@
+"""Gunicorn configuration for the web (``api``) role.
+
+Serves the ASGI app so the change-feed SSE endpoint is available and idle
+streams cost a coroutine rather than a worker:
+
+    gunicorn -c gunicorn.conf.py
+
+The listen address comes from ``GUNICORN_BIND`` (default ``0.0.0.0:8000``)
+and the number of worker processes from ``WEB_CONCURRENCY`` (default
+``2 * CPUs + 1``).
+
+Celery processes use the ``worker`` profile instead:
+
+    DJANGO_SETTINGS_MODULE=config.settings.worker celery -A config worker
+    DJANGO_SETTINGS_MODULE=config.settings.worker celery -A config beat
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+wsgi_app = 'config.asgi:application'
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# An explicit DJANGO_SETTINGS_MODULE wins; otherwise web processes load the
+# lean API profile.
+raw_env = [f"DJANGO_SETTINGS_MODULE={os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings.api')}"]
+
+# Import Django once in the master; workers fork with it already loaded,
+# which makes starting and replacing workers much faster.
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'True') == 'True'
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        from config.forksafe import before_fork
+
+        before_fork()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from config.forksafe import after_fork
+
+        after_fork()